@@ -34,6 +34,17 @@ class BaseAgent(ABC):
     - Role-specific behaviors
     """
     
+    # Agents are read on every timestep by the simulator, coordinator and
+    # renderer; slots make those lookups direct and the objects compact
+    __slots__ = (
+        'agent_id', 'agent_type', 'position', 'carrying_survivor',
+        'current_plan', 'current_path', 'target_position', 'assigned_tasks',
+        'steps_taken', 'blocked_steps', 'survivors_rescued', 'cells_explored',
+        'known_survivors', 'known_hazards', 'explored_cells', 'explored_count',
+        'communication_network', 'pending_messages', 'coalition_members',
+        '_path_cache', '_path_cache_stamp', 'logger',
+    )
+    
     def __init__(self, agent_id: str, agent_type: str, start_position: Tuple[int, int]):
         """
         Initialize agent.
@@ -68,12 +79,17 @@ class BaseAgent(ABC):
             'debris': []
         }
         self.explored_cells: set = set()
+        self.explored_count = 0  # len(explored_cells), kept by _mark_explored
         
         # Communication system (injected by simulator)
         self.communication_network = None
         self.pending_messages: List[Any] = []
         self.coalition_members: List[int] = []  # IDs of agents in same coalition
         
+        # Paths computed since the grid/risk model last changed
+        self._path_cache: Dict[Tuple[Tuple[int, int], Tuple[int, int]], Tuple[List[Tuple[int, int]], float]] = {}
+        self._path_cache_stamp: Optional[Tuple] = None
+        
         self.logger = get_logger()
     
     def perceive(self, grid, risk_model) -> Dict[str, Any]:
@@ -126,10 +142,16 @@ class BaseAgent(ABC):
         observations['risk'] = risk_model.get_all_risks(self.position)
         
         # Mark as explored
-        self.explored_cells.add(self.position)
+        self._mark_explored(self.position)
         
         return observations
     
+    def _mark_explored(self, pos: Tuple[int, int]):
+        """Add a cell to explored_cells, keeping explored_count in step."""
+        if pos not in self.explored_cells:
+            self.explored_cells.add(pos)
+            self.explored_count += 1
+    
     def update_beliefs(self, observations: Dict, grid, risk_model):
         """
         Update agent's beliefs based on observations.
@@ -140,33 +162,36 @@ class BaseAgent(ABC):
             risk_model: Risk model to update
         """
         x, y = self.position
-        
-        # Update risk beliefs
-        neighbors = grid.get_neighbors(x, y, diagonal=True)
-        neighbor_cells = [grid.get_cell(nx, ny) for nx, ny in neighbors if grid.get_cell(nx, ny)]
-        risk_model.update_from_observation(self.position, grid.get_cell(x, y), neighbor_cells)
-        
-        # Update known survivors
-        for nx, ny in neighbors:
-            cell = grid.get_cell(nx, ny)
-            if cell and cell.has_survivor:
-                pos = (nx, ny)
-                if pos not in self.known_survivors:
-                    self.known_survivors.append(pos)
-        
-        # Update known hazards
-        for nx, ny in neighbors:
+        known_survivors = self.known_survivors
+        known_fires = self.known_hazards['fire']
+        known_floods = self.known_hazards['flood']
+        known_debris = self.known_hazards['debris']
+        
+        # Single pass over the neighbourhood: each neighbour cell is fetched
+        # once and feeds the risk update as well as survivor/hazard beliefs
+        neighbor_cells = []
+        for nx, ny in grid.get_neighbors(x, y, diagonal=True):
             cell = grid.get_cell(nx, ny)
             if not cell:
                 continue
+            neighbor_cells.append(cell)
             
             pos = (nx, ny)
-            if cell.has_fire and pos not in self.known_hazards['fire']:
-                self.known_hazards['fire'].append(pos)
-            if cell.has_flood and pos not in self.known_hazards['flood']:
-                self.known_hazards['flood'].append(pos)
-            if cell.has_debris and pos not in self.known_hazards['debris']:
-                self.known_hazards['debris'].append(pos)
+            
+            # Update known survivors
+            if cell.has_survivor and pos not in known_survivors:
+                known_survivors.append(pos)
+            
+            # Update known hazards
+            if cell.has_fire and pos not in known_fires:
+                known_fires.append(pos)
+            if cell.has_flood and pos not in known_floods:
+                known_floods.append(pos)
+            if cell.has_debris and pos not in known_debris:
+                known_debris.append(pos)
+        
+        # Update risk beliefs
+        risk_model.update_from_observation(self.position, grid.get_cell(x, y), neighbor_cells)
     
     def move_to(self, target: Tuple[int, int], grid) -> bool:
         """
@@ -275,6 +300,49 @@ class BaseAgent(ABC):
         
         return False, f"Unknown action type: {action.type}"
     
+    def _compute_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                      grid, risk_model) -> Tuple[List[Tuple[int, int]], float]:
+        """
+        Compute a path with this agent's cost model, reusing earlier results.
+        
+        Args:
+            start: Start position
+            goal: Goal position
+            grid: Environment grid
+            risk_model: Risk model
+            
+        Returns:
+            (path, cost) from _search_path
+            
+        Rationale:
+            Path costs depend only on grid hazards and risk estimates, so a
+            result stays valid until either version counter moves. Within a
+            timestep, target selection and path execution query the same
+            (start, goal) pairs; the repeats become dict hits.
+        """
+        stamp = (grid, grid.version, risk_model, risk_model.version)
+        if stamp != self._path_cache_stamp:
+            self._path_cache.clear()
+            self._path_cache_stamp = stamp
+        
+        key = (start, goal)
+        result = self._path_cache.get(key)
+        if result is None:
+            result = self._search_path(start, goal, grid, risk_model)
+            self._path_cache[key] = result
+        return result
+    
+    @abstractmethod
+    def _search_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                     grid, risk_model) -> Tuple[List[Tuple[int, int]], float]:
+        """
+        Run the agent-specific A* search (implemented by subclasses).
+        
+        Returns:
+            (path, cost); ([], inf) if unreachable
+        """
+        pass
+    
     @abstractmethod
     def decide_action(self, grid, risk_model, **kwargs) -> Optional[Any]:
         """
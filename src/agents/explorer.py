@@ -12,11 +12,15 @@ Strategy:
 from typing import Tuple, Optional, List, Any, Dict
 from .base_agent import BaseAgent
 from ..utils.config import AgentType, ActionType, AGENT
-from ..ai.search import astar_search, compute_terrain_cost, compute_risk_cost
+from ..ai.search import astar_search, build_terrain_cost_lut, compute_risk_cost
 from ..ai.planner import STRIPSPlanner, Action
 import random
 
 
+# Penalize hazardous cells but still allow traversal
+_TERRAIN_COST_LUT = build_terrain_cost_lut(fire_penalty=100.0, debris_penalty=50.0)
+
+
 class ExplorerAgent(BaseAgent):
     """
     Explorer agent using BFS/DFS exploration and Bayesian risk updating.
@@ -31,6 +35,8 @@ class ExplorerAgent(BaseAgent):
     5. Update risk beliefs from observations
     """
     
+    __slots__ = ('planner', 'exploration_frontier', 'risk_threshold', 'curiosity_weight')
+    
     def __init__(self, agent_id: str, start_position: Tuple[int, int]):
         """Initialize explorer agent."""
         super().__init__(agent_id, AgentType.EXPLORER, start_position)
@@ -118,9 +124,8 @@ class ExplorerAgent(BaseAgent):
                 )
         
         # Check if need to replan
-        current_state = {'survivor_positions': set(grid.survivor_positions)}
         should_replan, reason = self.planner.replan_if_needed(
-            self.current_plan, self.position, current_state, self.blocked_steps
+            self.current_plan, self.position, grid, self.blocked_steps
         )
         
         if should_replan or not self.current_plan:
@@ -351,7 +356,7 @@ class ExplorerAgent(BaseAgent):
         
         return []
     
-    def _compute_path(self, start: Tuple[int, int], goal: Tuple[int, int], 
+    def _search_path(self, start: Tuple[int, int], goal: Tuple[int, int],
                      grid, risk_model) -> Tuple[List[Tuple[int, int]], float]:
         """
         Compute path using A* with risk awareness.
@@ -370,26 +375,20 @@ class ExplorerAgent(BaseAgent):
             # Allow traversing all cells (even hazardous) - cost will reflect danger
             return cell is not None
         
-        def get_neighbors(x, y):
-            return grid.get_neighbors(x, y, diagonal=False)
+        height = grid.height
+        flags = grid.flags
+        terrain_cost_lut = _TERRAIN_COST_LUT
         
         def get_terrain_cost(x, y):
-            cell = grid.get_cell(x, y)
-            if not cell:
+            if not grid.is_valid_position(x, y):
                 return float('inf')
-            # Penalize hazardous cells but still allow traversal
-            cost = compute_terrain_cost(cell)
-            if cell.has_fire:
-                cost += 100.0
-            if cell.has_debris:
-                cost += 50.0
-            return cost
+            return terrain_cost_lut[flags[x * height + y]]
         
         def get_risk_cost(x, y):
             risk = risk_model.get_risk((x, y), "combined")
             return compute_risk_cost(risk)
         
         return astar_search(
-            start, goal, is_passable, get_neighbors,
+            start, goal, is_passable, grid.get_neighbors,
             get_terrain_cost, get_risk_cost
         )
@@ -12,10 +12,15 @@ Strategy:
 from typing import Tuple, Optional, List, Any, Dict
 from .base_agent import BaseAgent
 from ..utils.config import AgentType, ActionType, AGENT
-from ..ai.search import astar_search, compute_terrain_cost, compute_risk_cost, find_nearest_goal
+from ..ai.search import astar_search, build_terrain_cost_lut, compute_terrain_cost_at, compute_risk_cost, find_nearest_goal
 from ..ai.planner import STRIPSPlanner, Action
 
 
+# CRITICAL: Heavily penalize fire/debris cells so they're last resort
+# (extreme penalty for fire, high penalty for debris)
+_TERRAIN_COST_LUT = build_terrain_cost_lut(fire_penalty=100.0, debris_penalty=50.0)
+
+
 class RescueAgent(BaseAgent):
     """
     Rescue agent using STRIPS planning and A* navigation.
@@ -29,6 +34,8 @@ class RescueAgent(BaseAgent):
     4. Handle blocked paths and changing hazards
     """
     
+    __slots__ = ('planner', 'risk_threshold', 'urgency_weight')
+    
     def __init__(self, agent_id: str, start_position: Tuple[int, int]):
         """Initialize rescue agent."""
         super().__init__(agent_id, AgentType.RESCUE, start_position)
@@ -119,9 +126,8 @@ class RescueAgent(BaseAgent):
             self.assigned_tasks = allocation[self.agent_id]
         
         # Check if need to replan
-        current_state = {'survivor_positions': set(grid.survivor_positions)}
         should_replan, reason = self.planner.replan_if_needed(
-            self.current_plan, self.position, current_state, self.blocked_steps
+            self.current_plan, self.position, grid, self.blocked_steps
         )
         
         if should_replan or not self.current_plan:
@@ -161,6 +167,12 @@ class RescueAgent(BaseAgent):
                         )
                 
                 # Not at destination yet - continue moving
+                # A path planned ahead of time is dropped if hazards have
+                # changed since; the stamp is checked once, on first use
+                path_version = action.parameters.pop('path_version', None)
+                if path_version is not None and path_version != grid.version:
+                    action.parameters['path'] = None
+                
                 if action.parameters.get('path') is None:
                     path, cost = self._compute_path(self.position, target, grid, risk_model)
                     action.parameters['path'] = path
@@ -259,18 +271,21 @@ class RescueAgent(BaseAgent):
             return []  # No survivors to rescue
         
         # Get safe zones
-        safe_zones = list(grid.safe_zone_positions)
+        safe_zones = grid.get_safe_zones()
         
         if not safe_zones:
             self.logger.log_error(self.agent_id, "No safe zones available!")
             return []
         
         # Generate rescue plan
+        # The safe zone leg is chosen by real path cost; its path is reused
+        # at TRANSPORT only if the grid is unchanged by then
         plan = self.planner.plan_rescue(
             self.position,
             target_survivor,
             safe_zones,
-            None  # Pathfinder not used in planning (we compute paths during execution)
+            lambda start, goals: self._search_nearest(start, goals, grid, risk_model),
+            path_version=grid.version
         )
         
         # Log plan
@@ -295,14 +310,14 @@ class RescueAgent(BaseAgent):
         Returns:
             Transport and drop actions
         """
-        safe_zones = list(grid.safe_zone_positions)
+        safe_zones = grid.get_safe_zones()
         
         # Find nearest safe zone
-        _, _, best_zone = find_nearest_goal(
+        best_zone, _, _ = find_nearest_goal(
             self.position, safe_zones,
-            lambda x, y: grid.get_cell(x, y) is not None and grid.get_cell(x, y).is_passable(),
-            lambda x, y: grid.get_neighbors(x, y, diagonal=False),
-            lambda x, y: compute_terrain_cost(grid.get_cell(x, y)) if grid.get_cell(x, y) else float('inf'),
+            grid.is_passable,
+            grid.get_neighbors,
+            lambda x, y: compute_terrain_cost_at(grid, x, y) if grid.is_valid_position(x, y) else float('inf'),
             lambda x, y: compute_risk_cost(risk_model.get_risk((x, y), "combined"))
         )
         
@@ -406,46 +421,66 @@ class RescueAgent(BaseAgent):
         
         return None
     
-    def _compute_path(self, start: Tuple[int, int], goal: Tuple[int, int],
-                     grid, risk_model) -> Tuple[List[Tuple[int, int]], float]:
+    def _path_callbacks(self, grid, risk_model):
         """
-        Compute path using risk-aware A*.
+        Build the rescue agent's A* callbacks.
         
         Args:
-            start: Start position
-            goal: Goal position
             grid: Environment grid
             risk_model: Risk model
             
         Returns:
-            (path, cost)
+            (is_passable, get_neighbors, get_terrain_cost, get_risk_cost)
         """
-        def is_passable(x, y):
-            cell = grid.get_cell(x, y)
-            # For rescue operations, allow traversing fire/debris cells if necessary
-            # (high cost will discourage them, but they won't be blocked completely)
-            return cell is not None
+        # For rescue operations, allow traversing fire/debris cells if necessary
+        # (high cost will discourage them, but they won't be blocked completely)
+        is_passable = grid.is_valid_position
         
-        def get_neighbors(x, y):
-            return grid.get_neighbors(x, y, diagonal=False)
+        height = grid.height
+        flags = grid.flags
+        terrain_cost_lut = _TERRAIN_COST_LUT
         
         def get_terrain_cost(x, y):
-            cell = grid.get_cell(x, y)
-            if not cell:
+            if not grid.is_valid_position(x, y):
                 return float('inf')
-            # CRITICAL: Heavily penalize fire/debris cells so they're last resort
-            cost = compute_terrain_cost(cell)
-            if cell.has_fire:
-                cost += 100.0  # Extreme penalty for fire
-            if cell.has_debris:
-                cost += 50.0   # High penalty for debris
-            return cost
+            return terrain_cost_lut[flags[x * height + y]]
         
         def get_risk_cost(x, y):
             risk = risk_model.get_risk((x, y), "combined")
             return compute_risk_cost(risk)
         
-        return astar_search(
-            start, goal, is_passable, get_neighbors,
-            get_terrain_cost, get_risk_cost
-        )
+        return is_passable, grid.get_neighbors, get_terrain_cost, get_risk_cost
+    
+    def _search_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+                     grid, risk_model) -> Tuple[List[Tuple[int, int]], float]:
+        """
+        Compute path using risk-aware A*.
+        
+        Args:
+            start: Start position
+            goal: Goal position
+            grid: Environment grid
+            risk_model: Risk model
+            
+        Returns:
+            (path, cost)
+        """
+        return astar_search(start, goal, *self._path_callbacks(grid, risk_model))
+    
+    def _search_nearest(self, start: Tuple[int, int], goals, grid, risk_model):
+        """
+        Find a cheap goal among several under the rescue cost model.
+        
+        Args:
+            start: Start position
+            goals: Candidate goal positions
+            grid: Environment grid
+            risk_model: Risk model
+            
+        Returns:
+            (best_goal, path, cost) as from find_nearest_goal
+        
+        find_nearest_goal returns the first goal its risk-weighted search
+        reaches, which is usually but not always the cheapest.
+        """
+        return find_nearest_goal(start, goals, *self._path_callbacks(grid, risk_model))
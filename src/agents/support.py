@@ -12,10 +12,15 @@ Strategy:
 from typing import Tuple, Optional, List, Any, Dict
 from .base_agent import BaseAgent
 from ..utils.config import AgentType, ActionType, AGENT
-from ..ai.search import astar_search, compute_terrain_cost, compute_risk_cost
+from ..ai.search import astar_search, build_terrain_cost_lut, compute_risk_cost
 from ..ai.planner import STRIPSPlanner, Action
 
 
+# Support agent tolerates hazards but still prefers safer routes
+# (lower fire/debris penalties than the other agents)
+_TERRAIN_COST_LUT = build_terrain_cost_lut(fire_penalty=50.0, debris_penalty=25.0)
+
+
 class SupportAgent(BaseAgent):
     """
     Support agent using CSP-based coordination.
@@ -29,6 +34,11 @@ class SupportAgent(BaseAgent):
     4. Handle edge cases (stuck agents, blocked paths)
     """
     
+    __slots__ = (
+        'planner', 'risk_threshold', 'coordination_weight', 'monitored_agents',
+        'support_targets', 'suppression_cooldown', 'suppression_active_until',
+    )
+    
     def __init__(self, agent_id: str, start_position: Tuple[int, int]):
         """Initialize support agent."""
         super().__init__(agent_id, AgentType.SUPPORT, start_position)
@@ -137,9 +147,8 @@ class SupportAgent(BaseAgent):
             return suppression_action
         
         # Check if need to replan
-        current_state = {'survivor_positions': set(grid.survivor_positions)}
         should_replan, reason = self.planner.replan_if_needed(
-            self.current_plan, self.position, current_state, self.blocked_steps
+            self.current_plan, self.position, grid, self.blocked_steps
         )
         
         if should_replan or not self.current_plan:
@@ -489,7 +498,7 @@ class SupportAgent(BaseAgent):
             cost=1.0
         )
     
-    def _compute_path(self, start: Tuple[int, int], goal: Tuple[int, int],
+    def _search_path(self, start: Tuple[int, int], goal: Tuple[int, int],
                      grid, risk_model) -> Tuple[List[Tuple[int, int]], float]:
         """
         Compute path with highest risk tolerance.
@@ -508,20 +517,14 @@ class SupportAgent(BaseAgent):
             # Support agent - allow traversing hazardous cells
             return cell is not None
         
-        def get_neighbors(x, y):
-            return grid.get_neighbors(x, y, diagonal=False)
+        height = grid.height
+        flags = grid.flags
+        terrain_cost_lut = _TERRAIN_COST_LUT
         
         def get_terrain_cost(x, y):
-            cell = grid.get_cell(x, y)
-            if not cell:
+            if not grid.is_valid_position(x, y):
                 return float('inf')
-            # Support agent tolerates hazards but still prefers safer routes
-            cost = compute_terrain_cost(cell)
-            if cell.has_fire:
-                cost += 50.0  # Lower penalty for support agent
-            if cell.has_debris:
-                cost += 25.0
-            return cost
+            return terrain_cost_lut[flags[x * height + y]]
         
         def get_risk_cost(x, y):
             risk = risk_model.get_risk((x, y), "combined")
@@ -529,6 +532,6 @@ class SupportAgent(BaseAgent):
             return compute_risk_cost(risk) * 0.3  # Even more tolerant now
         
         return astar_search(
-            start, goal, is_passable, get_neighbors,
+            start, goal, is_passable, grid.get_neighbors,
             get_terrain_cost, get_risk_cost
         )
@@ -52,8 +52,19 @@ class BayesianRiskModel:
         self.flood_risk: Dict[Tuple[int, int], float] = {}
         self.collapse_risk: Dict[Tuple[int, int], float] = {}
         
+        # Combined risk, precomputed from the three maps whenever a cell is
+        # written so the hot "combined" query is a single lookup
+        self.combined_risk: Dict[Tuple[int, int], float] = {}
+        self.prior_combined = self._combine(self.prior_fire, self.prior_flood, self.prior_collapse)
+        
         # Observation counts for confidence
         self.observation_count: Dict[Tuple[int, int], int] = {}
+        
+        # Bumped on every change to the risk maps (lets path caches expire)
+        self.version: int = 0
+        
+        # get_all_risks() results, dropped per cell when the cell is updated
+        self._all_risks_cache: Dict[Tuple[int, int], Dict[str, float]] = {}
     
     def initialize_grid(self, width: int, height: int):
         """
@@ -69,7 +80,10 @@ class BayesianRiskModel:
                 self.fire_risk[pos] = self.prior_fire
                 self.flood_risk[pos] = self.prior_flood
                 self.collapse_risk[pos] = self.prior_collapse
+                self.combined_risk[pos] = self.prior_combined
                 self.observation_count[pos] = 0
+        self._all_risks_cache.clear()
+        self.version += 1
     
     def update_from_observation(self, position: Tuple[int, int], cell, neighbors_info: list):
         """
@@ -104,6 +118,14 @@ class BayesianRiskModel:
         
         # Update collapse risk
         self.collapse_risk[position] = self._compute_collapse_risk(cell, neighbors_info)
+        
+        self.combined_risk[position] = self._combine(
+            self.fire_risk[position],
+            self.flood_risk[position],
+            self.collapse_risk[position]
+        )
+        self._all_risks_cache.pop(position, None)
+        self.version += 1
     
     def _compute_fire_risk(self, cell, neighbors_info) -> float:
         """
@@ -220,12 +242,16 @@ class BayesianRiskModel:
         elif risk_type == "collapse":
             return self.collapse_risk.get(position, self.prior_collapse)
         else:  # combined
-            # Combined risk: probability of at least one hazard
-            # P(A ∪ B ∪ C) ≈ 1 - (1-P(A))(1-P(B))(1-P(C))
-            fire = self.fire_risk.get(position, self.prior_fire)
-            flood = self.flood_risk.get(position, self.prior_flood)
-            collapse = self.collapse_risk.get(position, self.prior_collapse)
-            return 1.0 - (1.0 - fire) * (1.0 - flood) * (1.0 - collapse)
+            return self.combined_risk.get(position, self.prior_combined)
+    
+    @staticmethod
+    def _combine(fire: float, flood: float, collapse: float) -> float:
+        """
+        Combined risk: probability of at least one hazard.
+        
+        P(A ∪ B ∪ C) ≈ 1 - (1-P(A))(1-P(B))(1-P(C))
+        """
+        return 1.0 - (1.0 - fire) * (1.0 - flood) * (1.0 - collapse)
     
     def get_all_risks(self, position: Tuple[int, int]) -> Dict[str, float]:
         """
@@ -235,14 +261,26 @@ class BayesianRiskModel:
             position: Cell coordinates
             
         Returns:
-            Dictionary with all risk types
-        """
-        return {
-            "fire": self.get_risk(position, "fire"),
-            "flood": self.get_risk(position, "flood"),
-            "collapse": self.get_risk(position, "collapse"),
-            "combined": self.get_risk(position, "combined")
-        }
+            Dictionary with all risk types (shared between calls until the
+            cell is next observed - do not mutate)
+            
+        Rationale:
+            Queried for every agent position on every timestep, while a
+            cell's risks only change when that cell is observed. Results are
+            memoized per cell and invalidated by update_from_observation.
+        """
+        risks = self._all_risks_cache.get(position)
+        if risks is None:
+            fire = self.fire_risk.get(position, self.prior_fire)
+            flood = self.flood_risk.get(position, self.prior_flood)
+            collapse = self.collapse_risk.get(position, self.prior_collapse)
+            risks = self._all_risks_cache[position] = {
+                "fire": fire,
+                "flood": flood,
+                "collapse": collapse,
+                "combined": self.combined_risk.get(position, self.prior_combined)
+            }
+        return risks
     
     def get_confidence(self, position: Tuple[int, int]) -> float:
         """
@@ -294,7 +332,7 @@ class BayesianRiskModel:
             grad_y += risk * dy
         
         # Normalize
-        magnitude = math.sqrt(grad_x**2 + grad_y**2)
+        magnitude = math.hypot(grad_x, grad_y)
         if magnitude > 0:
             grad_x /= magnitude
             grad_y /= magnitude
@@ -522,16 +560,7 @@ class BayesianRiskModel:
         std_dev = base_std * math.exp(-obs_count / 10.0) + min_std
         
         # Compute 95% confidence interval (1.96 * std_dev)
-        lower = max(0.0, mean_risk - 1.96 * std_dev)
-        upper = min(1.0, mean_risk + 1.96 * std_dev)
-        
-        return ConfidenceInterval(
-            mean=mean_risk,
-            lower_bound=lower,
-            upper_bound=upper,
-            std_dev=std_dev,
-            confidence_level=0.95
-        )
+        return ConfidenceInterval.from_normal(mean_risk, std_dev, 0.0, 1.0)
     
     def predict_risk_with_confidence(
         self,
@@ -571,16 +600,7 @@ class BayesianRiskModel:
         std_dev = min(0.5, base_std + temporal_uncertainty)  # Cap at 0.5
         
         # Compute 95% confidence interval
-        lower = max(0.0, mean_risk - 1.96 * std_dev)
-        upper = min(1.0, mean_risk + 1.96 * std_dev)
-        
-        return ConfidenceInterval(
-            mean=mean_risk,
-            lower_bound=lower,
-            upper_bound=upper,
-            std_dev=std_dev,
-            confidence_level=0.95
-        )
+        return ConfidenceInterval.from_normal(mean_risk, std_dev, 0.0, 1.0)
     
     def get_environmental_assessment_with_confidence(
         self,
@@ -623,15 +643,6 @@ class BayesianRiskModel:
         std_error = std_dev / math.sqrt(n)
         
         # 95% confidence interval for the mean
-        lower = max(0.0, mean - 1.96 * std_error)
-        upper = min(1.0, mean + 1.96 * std_error)
-        
-        confidence = ConfidenceInterval(
-            mean=mean,
-            lower_bound=lower,
-            upper_bound=upper,
-            std_dev=std_error,
-            confidence_level=0.95
-        )
+        confidence = ConfidenceInterval.from_normal(mean, std_error, 0.0, 1.0)
         
         return mean, confidence
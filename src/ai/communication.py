@@ -228,15 +228,23 @@ class CommunicationNetwork:
         return messages
     
     def advance_timestep(self):
-        """Increment timestep counter and clean up expired messages."""
+        """
+        Increment timestep counter and clean up expired messages.
+        
+        Called every simulation timestep for every registered agent, while
+        most queues are empty or hold only live messages, so a queue is
+        only rebuilt when it actually contains an expired message.
+        """
         self.current_timestep += 1
+        current_time = self.current_timestep
         
         # Remove expired messages from all queues
-        for agent_id in self.message_queues:
-            self.message_queues[agent_id] = [
-                msg for msg in self.message_queues[agent_id]
-                if not msg.is_expired(self.current_timestep)
-            ]
+        for agent_id, queue in self.message_queues.items():
+            if queue and any(msg.is_expired(current_time) for msg in queue):
+                self.message_queues[agent_id] = [
+                    msg for msg in queue
+                    if not msg.is_expired(current_time)
+                ]
     
     def get_message_count(self, agent_id: int) -> int:
         """Get number of pending messages for an agent."""
@@ -127,6 +127,10 @@ class HybridCoordinator:
         # NEW v2.1: Explainability engine for decision transparency
         self.explanation_engine = ExplanationEngine(enable_logging=enable_explanations) if enable_explanations else None
         self.last_explanation: Optional[DecisionExplanation] = None
+        
+        # Survivor dispersion of the last assessed survivor list
+        self._dispersion_key: Optional[Tuple[Tuple[int, int], ...]] = None
+        self._dispersion_score = 0.0
     
     def assess_environment(
         self,
@@ -184,8 +188,8 @@ class HybridCoordinator:
         
         # Compute exploration coverage
         explored_cells = sum(
-            1 for info in agents.values()
-            for cell in info.get('explored_cells', set())
+            len(info.get('explored_cells', ()))
+            for info in agents.values()
         )
         total_cells = grid.width * grid.height
         exploration_coverage = explored_cells / total_cells if total_cells > 0 else 0.0
@@ -351,6 +355,36 @@ class HybridCoordinator:
         avg_risk = statistics.mean(risks) if risks else 0.0
         
         # Factor 3: Spatial dispersion
+        dispersion_score = self._survivor_dispersion(survivors)
+        
+        # Weighted combination
+        complexity = (
+            0.4 * overload_score +
+            0.4 * avg_risk +
+            0.2 * dispersion_score
+        )
+        
+        return min(complexity, 1.0)
+    
+    def _survivor_dispersion(self, survivors: List[Tuple[int, int]]) -> float:
+        """
+        Normalized mean pairwise Manhattan distance between survivors.
+        
+        Args:
+            survivors: Survivor positions
+            
+        Returns:
+            Dispersion score [0.0, 1.0]
+            
+        Rationale:
+            The pairwise pass is O(S^2) and depends on the survivors alone,
+            which usually stay put for many timesteps while agents move.
+            The score is recomputed only when the survivor list changes.
+        """
+        key = tuple(survivors)
+        if key == self._dispersion_key:
+            return self._dispersion_score
+        
         if len(survivors) > 1:
             # Compute pairwise distances
             distances = []
@@ -362,14 +396,9 @@ class HybridCoordinator:
         else:
             dispersion_score = 0.0
         
-        # Weighted combination
-        complexity = (
-            0.4 * overload_score +
-            0.4 * avg_risk +
-            0.2 * dispersion_score
-        )
-        
-        return min(complexity, 1.0)
+        self._dispersion_key = key
+        self._dispersion_score = dispersion_score
+        return dispersion_score
     
     def _allocate_with_coalitions(
         self,
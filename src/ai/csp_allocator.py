@@ -30,17 +30,41 @@ class Assignment:
         distance: Distance from agent to survivor
         risk: Risk level for assignment
         priority: Assignment priority (lower = higher priority)
+        survivor_idx: Index of the survivor in the allocation's survivor list
     """
     agent_id: str
     survivor_pos: Tuple[int, int]
     distance: float
     risk: float
     priority: float
+    survivor_idx: int = -1
     
     def __repr__(self) -> str:
         return f"{self.agent_id} -> {self.survivor_pos} (d={self.distance:.1f}, r={self.risk:.2f})"
 
 
+def _make_priority_func(distance_weight: float, risk_weight: float):
+    """
+    Build the assignment priority function with the weights baked in.
+    
+    Args:
+        distance_weight: Weight of the distance term
+        risk_weight: Weight of the (x100 scaled) risk term
+        
+    Returns:
+        Function (distance, risk) -> priority (lower = higher priority)
+        
+    Rationale:
+        The weights are constant for a run; binding them as default-argument
+        locals avoids two attribute lookups per (agent, survivor) evaluation.
+    """
+    def priority(distance: float, risk: float,
+                 _dw: float = distance_weight, _rw: float = risk_weight) -> float:
+        return _dw * distance + _rw * risk * 100  # Scale risk to comparable magnitude
+    
+    return priority
+
+
 class CSPAllocator:
     """
     CSP-based task allocation for multi-agent rescue coordination.
@@ -61,6 +85,14 @@ class CSPAllocator:
         self.risk_threshold = AI.CSP_RISK_CONSTRAINT_THRESHOLD
         self.distance_weight = AI.CSP_DISTANCE_WEIGHT
         self.risk_weight = AI.CSP_RISK_WEIGHT
+        
+        # Weights are fixed for the allocator's lifetime
+        self._priority = _make_priority_func(self.distance_weight, self.risk_weight)
+        
+        # Distance rows persisted between timesteps: agent_pos -> {survivor_pos: distance}.
+        # Only valid for the distance function they were computed with.
+        self._distance_rows: Dict[Tuple[int, int], Dict[Tuple[int, int], float]] = {}
+        self._distance_func = None
     
     def allocate(
         self,
@@ -76,7 +108,10 @@ class CSPAllocator:
             agents: Dictionary of agent_id -> {position, type, current_load, ...}
             survivors: List of survivor positions
             risk_model: Bayesian risk model for risk queries
-            distance_func: Function to compute distance between positions
+            distance_func: Function to compute distance between positions.
+                Called A*S times per allocation, so prefer plain module-level
+                functions such as search.manhattan_distance or
+                search.euclidean_distance (math.hypot-backed)
             
         Returns:
             Dictionary mapping agent_id -> list of assigned survivor positions
@@ -101,6 +136,12 @@ class CSPAllocator:
             rescue_agents, survivors, risk_model, distance_func
         )
         
+        # Fast path: if every survivor's best agent stays within capacity the
+        # greedy pass would pick exactly those agents, so skip the full sort
+        allocation = self._best_agent_allocate(possible_assignments, rescue_agents)
+        if allocation is not None:
+            return allocation
+        
         # Sort by priority (lower = better)
         possible_assignments.sort(key=lambda a: a.priority)
         
@@ -132,37 +173,130 @@ class CSPAllocator:
         """
         assignments = []
         
+        # Integer survivor ids let the greedy pass use a flat mask instead of
+        # hashing position tuples (duplicate positions share one id)
+        pos_to_idx = {pos: i for i, pos in enumerate(survivors)}
+        
+        # Risk depends only on the survivor: query it once per survivor and
+        # drop survivors that violate the risk threshold up front
+        feasible_survivors = []
+        for survivor_pos in survivors:
+            risk = risk_model.get_risk(survivor_pos, "combined")
+            if risk > self.risk_threshold:
+                continue  # Too risky
+            # Scale risk to magnitude comparable with distance
+            risk_term = self.risk_weight * risk * 100
+            feasible_survivors.append((survivor_pos, pos_to_idx[survivor_pos], risk, risk_term))
+        
+        distance_weight = self.distance_weight
+        distance_rows = self._get_distance_rows(
+            agents, [s[0] for s in feasible_survivors], distance_func
+        )
+        
         for agent_id, agent_info in agents.items():
             agent_pos = agent_info['position']
+            distances = distance_rows[agent_pos]
             
-            for survivor_pos in survivors:
-                # Compute distance
-                distance = distance_func(agent_pos, survivor_pos)
-                
-                # Compute risk along path
-                risk = risk_model.get_risk(survivor_pos, "combined")
-                
-                # Constraint check: Risk threshold
-                if risk > self.risk_threshold:
-                    continue  # Too risky
+            for survivor_pos, survivor_idx, risk, risk_term in feasible_survivors:
+                distance = distances[survivor_pos]
                 
                 # Compute priority (lower = higher priority)
                 # Weighted combination of distance and risk
-                priority = (
-                    self.distance_weight * distance +
-                    self.risk_weight * risk * 100  # Scale risk to comparable magnitude
-                )
-                
                 assignments.append(Assignment(
                     agent_id=agent_id,
                     survivor_pos=survivor_pos,
                     distance=distance,
                     risk=risk,
-                    priority=priority
+                    priority=distance_weight * distance + risk_term,
+                    survivor_idx=survivor_idx
                 ))
         
         return assignments
     
+    def _get_distance_rows(
+        self,
+        agents: Dict,
+        survivors: List[Tuple[int, int]],
+        distance_func
+    ) -> Dict[Tuple[int, int], Dict[Tuple[int, int], float]]:
+        """
+        Get agent -> survivor distances, reusing rows from previous timesteps.
+        
+        Args:
+            agents: Agent information
+            survivors: Survivor positions that need a distance
+            distance_func: Distance computation
+            
+        Returns:
+            Mapping agent_pos -> {survivor_pos: distance}
+            
+        Rationale:
+            Between consecutive timesteps most agents and survivors do not
+            move, so only rows of agents that moved (and entries for newly
+            seen survivors) need distance_func calls. Rows for positions no
+            agent occupies anymore are dropped.
+        """
+        if distance_func is not self._distance_func:
+            self._distance_rows = {}
+            self._distance_func = distance_func
+        
+        previous_rows = self._distance_rows
+        rows: Dict[Tuple[int, int], Dict[Tuple[int, int], float]] = {}
+        
+        for agent_info in agents.values():
+            agent_pos = agent_info['position']
+            if agent_pos in rows:
+                continue
+            
+            row = previous_rows.get(agent_pos)
+            if row is None:
+                row = {}
+            for survivor_pos in survivors:
+                if survivor_pos not in row:
+                    row[survivor_pos] = distance_func(agent_pos, survivor_pos)
+            rows[agent_pos] = row
+        
+        self._distance_rows = rows
+        return rows
+    
+    def _best_agent_allocate(
+        self,
+        assignments: List[Assignment],
+        agents: Dict
+    ) -> Optional[Dict[str, List[Tuple[int, int]]]]:
+        """
+        Assign every survivor to its lowest-priority agent when capacity allows.
+        
+        Args:
+            assignments: Unsorted list of possible assignments (agent-major order)
+            agents: Agent information
+            
+        Returns:
+            Allocation mapping, or None if some agent would exceed capacity
+            
+        Note:
+            Produces the same allocation as the sorted greedy pass whenever the
+            capacity constraint is not binding, including tie-breaking (earlier
+            agent wins) and per-agent ordering (by priority, then survivor order).
+        """
+        best: Dict[int, Assignment] = {}
+        for assignment in assignments:
+            current = best.get(assignment.survivor_idx)
+            if current is None or assignment.priority < current.priority:
+                best[assignment.survivor_idx] = assignment
+        
+        allocation: Dict[str, List[Assignment]] = {aid: [] for aid in agents.keys()}
+        for assignment in best.values():
+            chosen = allocation[assignment.agent_id]
+            if len(chosen) >= self.max_survivors_per_agent:
+                return None  # Capacity is binding - need the full greedy pass
+            chosen.append(assignment)
+        
+        return {
+            aid: [a.survivor_pos for a in sorted(chosen, key=lambda a: a.priority)]
+            for aid, chosen in allocation.items()
+        }
+    
     def _greedy_allocate(
         self,
         assignments: List[Assignment],
@@ -189,15 +323,23 @@ class CSPAllocator:
             aid: [] for aid in agents.keys()
         }
         
-        assigned_survivors: Set[Tuple[int, int]] = set()
+        # Assigned flags indexed by Assignment.survivor_idx
+        assigned_mask = bytearray(len(survivors))
         agent_load: Dict[str, int] = {aid: 0 for aid in agents.keys()}
         
+        # Stop once every survivor is placed or every agent is full
+        max_assignable = min(
+            len(set(survivors)),
+            self.max_survivors_per_agent * len(agent_load)
+        )
+        num_assigned = 0
+        
         for assignment in assignments:
             agent_id = assignment.agent_id
-            survivor_pos = assignment.survivor_pos
+            survivor_idx = assignment.survivor_idx
             
             # Check if survivor already assigned
-            if survivor_pos in assigned_survivors:
+            if assigned_mask[survivor_idx]:
                 continue
             
             # Check agent capacity constraint
@@ -205,9 +347,13 @@ class CSPAllocator:
                 continue
             
             # Assign
-            allocation[agent_id].append(survivor_pos)
-            assigned_survivors.add(survivor_pos)
+            allocation[agent_id].append(assignment.survivor_pos)
+            assigned_mask[survivor_idx] = 1
             agent_load[agent_id] += 1
+            
+            num_assigned += 1
+            if num_assigned == max_assignable:
+                break
         
         return allocation
     
@@ -240,34 +386,27 @@ class CSPAllocator:
                 s for s in current_allocation[failed_agent] if s != failed_survivor
             ]
         
-        # Find alternative agent
-        rescue_agents = {
-            aid: info for aid, info in agents.items()
+        # Risk depends only on the survivor, so query it once: if it breaks
+        # the safety constraint no agent can take the task.
+        risk = risk_model.get_risk(failed_survivor, "combined")
+        if risk > self.risk_threshold:
+            return None
+        risk_term = self.risk_weight * risk * 100
+        
+        # Find alternative agent with spare capacity
+        candidates = [
+            (aid, info['position']) for aid, info in agents.items()
             if info.get('type') == 'RESCUE' and aid != failed_agent
-        }
+            and len(current_allocation.get(aid, ())) < self.max_survivors_per_agent
+        ]
         
         best_agent = None
-        best_priority = float('inf')
-        
-        for agent_id, agent_info in rescue_agents.items():
-            # Check capacity
-            current_load = len(current_allocation.get(agent_id, []))
-            if current_load >= self.max_survivors_per_agent:
-                continue
-            
-            # Compute assignment cost
-            agent_pos = agent_info['position']
-            distance = distance_func(agent_pos, failed_survivor)
-            risk = risk_model.get_risk(failed_survivor, "combined")
-            
-            if risk > self.risk_threshold:
-                continue
-            
-            priority = self.distance_weight * distance + self.risk_weight * risk * 100
-            
-            if priority < best_priority:
-                best_priority = priority
-                best_agent = agent_id
+        if candidates:
+            # Single min() pass; ties resolve to the first candidate
+            best_agent, _ = min(
+                candidates,
+                key=lambda c: self.distance_weight * distance_func(c[1], failed_survivor) + risk_term
+            )
         
         # Assign to new agent
         if best_agent:
@@ -290,18 +429,18 @@ class CSPAllocator:
         if not allocation:
             return "No allocations"
         
-        summary = "Task Allocation:\n"
+        parts = ["Task Allocation:"]
         
         for agent_id, survivors in allocation.items():
             if survivors:
-                summary += f"  {agent_id}: {len(survivors)} survivor(s) at {survivors}\n"
+                parts.append(f"  {agent_id}: {len(survivors)} survivor(s) at {survivors}")
             else:
-                summary += f"  {agent_id}: No assignments\n"
+                parts.append(f"  {agent_id}: No assignments")
         
         total_assigned = sum(len(s) for s in allocation.values())
-        summary += f"Total assigned: {total_assigned}"
+        parts.append(f"Total assigned: {total_assigned}")
         
-        return summary
+        return "\n".join(parts)
     
     def allocate_auction(
         self,
@@ -440,6 +579,8 @@ class CSPAllocator:
             for survivor_pos in survivor_list:
                 survivor_to_agent[survivor_pos] = agent_id
         
+        priority = self._priority
+        
         # Iterative improvement
         improved = True
         max_iterations = 5
@@ -457,8 +598,7 @@ class CSPAllocator:
                     current_pos = agents[current_agent]['position']
                     current_distance = distance_func(current_pos, survivor_pos)
                     current_risk = risk_model.get_risk(survivor_pos, "combined")
-                    current_score = (self.distance_weight * current_distance +
-                                   self.risk_weight * current_risk * 100)
+                    current_score = priority(current_distance, current_risk)
                 else:
                     current_score = float('inf')
                 
@@ -482,8 +622,7 @@ class CSPAllocator:
                     if risk > self.risk_threshold:
                         continue
                     
-                    score = (self.distance_weight * distance +
-                            self.risk_weight * risk * 100)
+                    score = priority(distance, risk)
                     
                     # Require significant improvement (10%) to switch
                     if score < best_score * 0.9:
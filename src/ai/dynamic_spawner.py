@@ -71,7 +71,7 @@ class DynamicSpawner:
         
         # Check exploration coverage
         total_cells = grid.width * grid.height
-        explored_cells = sum(len(a.explored_cells) for a in agents)
+        explored_cells = sum(a.explored_count for a in agents)
         exploration_ratio = explored_cells / total_cells if total_cells > 0 else 0
         
         # Spawn explorer if exploration is lagging
@@ -16,15 +16,26 @@ Author: Multi-Agent Rescue System Team
 Patent Pending: Explainable Risk-Aware Task Reallocation (2026)
 """
 
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
-from enum import Enum
+from itertools import islice
+from functools import partial
+from typing import Callable, Deque, Dict, Final, List, Optional, Tuple, Any, TextIO
+import heapq
+import io
+import json
 import math
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from ..utils.compat import DATACLASS_SLOTS, StrEnum
 
 
-class DecisionType(Enum):
-    """Types of decisions that can be explained."""
+class DecisionType(StrEnum):
+    """
+    Types of decisions that can be explained.
+    
+    Members are strings, so they serialize and format without a .value lookup.
+    """
     TASK_ALLOCATION = "task_allocation"
     COALITION_FORMATION = "coalition_formation"
     MODE_SWITCH = "coordination_mode_switch"
@@ -33,7 +44,82 @@ class DecisionType(Enum):
     TASK_REALLOCATION = "task_reallocation"
 
 
-@dataclass
+# z-score of a two-sided 95% normal confidence interval
+Z_95: Final[float] = 1.96
+
+# Risk thresholds reported as mode-switch decision factors
+MODE_THRESHOLD_LOW: Final[float] = 0.3
+MODE_THRESHOLD_HIGH: Final[float] = 0.7
+
+# Coalition risk-reduction interval: conservative/optimistic multipliers and spread
+COALITION_LOWER_MULT: Final[float] = 0.7
+COALITION_UPPER_MULT: Final[float] = 1.3
+COALITION_STD_MULT: Final[float] = 0.15
+
+# Spawn workload interval: ±10% bounds with 5% spread
+SPAWN_LOWER_MULT: Final[float] = 0.9
+SPAWN_UPPER_MULT: Final[float] = 1.1
+SPAWN_STD_MULT: Final[float] = 0.05
+
+# Primary explanation templates
+_COALITION_EXPLANATION = "Formed coalition of {n} agents to handle high-risk task at {loc}"
+_ALLOCATION_EXPLANATION = "Allocated {task} task at {loc} to Agent {agent} via auction"
+
+# Mode-switch reason templates keyed by new mode name (formatted with avg risk)
+_MODE_REASON_TEMPLATES = {
+    "CENTRALIZED": "Low environmental risk ({:.2f}) enables centralized CSP optimization",
+    "AUCTION": "Moderate risk ({:.2f}) requires distributed auction-based allocation",
+    "COALITION": "High risk ({:.2f}) necessitates coalition formation for safety",
+}
+_DEFAULT_MODE_REASON_TEMPLATE = "Risk assessment ({:.2f}) triggered mode change"
+
+
+def _mean_std(values: List[float]) -> Tuple[float, float]:
+    """
+    Single-pass mean and population standard deviation (Welford's algorithm).
+    
+    Args:
+        values: Non-empty list of samples
+    
+    Returns:
+        Tuple of (mean, std_dev)
+    
+    Rationale:
+        One pass over the data and numerically stable, unlike the naive
+        two-pass sum of squared deviations.
+    """
+    mean = 0.0
+    m2 = 0.0
+    for n, value in enumerate(values, 1):
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    return mean, math.sqrt(m2 / len(values))
+
+
+def _auction_alternatives(
+    losing_bids: List[Tuple[int, float]],
+    winning_bid: float
+) -> List[Dict[str, Any]]:
+    """
+    Build counterfactual entries for the runner-up bids of an auction.
+    
+    Args:
+        losing_bids: (agent_id, bid) pairs in ascending bid order
+        winning_bid: Cost of the winning bid
+    
+    Returns:
+        One alternative dict per losing bid
+    """
+    return [{
+        "description": f"Assign to Agent {agent_id} (bid: {bid:.2f})",
+        "expected_utility": -bid,  # Lower bid = higher utility
+        "rejection_reason": f"Higher cost by {bid - winning_bid:.2f}",
+        "predicted_outcome": f"Task completed with {bid:.2f} cost"
+    } for agent_id, bid in losing_bids]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ConfidenceInterval:
     """
     Represents uncertainty in predictions using Bayesian statistics.
@@ -46,6 +132,35 @@ class ConfidenceInterval:
     std_dev: float
     confidence_level: float = 0.95
     
+    @classmethod
+    def from_normal(
+        cls,
+        mean: float,
+        std_dev: float,
+        lower_limit: Optional[float] = None,
+        upper_limit: Optional[float] = None
+    ) -> 'ConfidenceInterval':
+        """
+        Build a 95% interval (mean ± Z_95·σ) with optional clamping.
+        
+        Args:
+            mean: Point estimate
+            std_dev: Standard deviation (or standard error) of the estimate
+            lower_limit: Smallest allowed lower bound (None = unclamped)
+            upper_limit: Largest allowed upper bound (None = unclamped)
+        
+        Returns:
+            ConfidenceInterval centred on mean
+        """
+        half_width = Z_95 * std_dev
+        lower = mean - half_width
+        upper = mean + half_width
+        if lower_limit is not None:
+            lower = max(lower_limit, lower)
+        if upper_limit is not None:
+            upper = min(upper_limit, upper)
+        return cls(mean=mean, lower_bound=lower, upper_bound=upper, std_dev=std_dev)
+    
     def __str__(self) -> str:
         """Human-readable confidence interval."""
         return f"{self.mean:.2f} (95% CI: [{self.lower_bound:.2f}, {self.upper_bound:.2f}])"
@@ -61,13 +176,16 @@ class ConfidenceInterval:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DecisionExplanation:
     """
     Structured explanation for a single coordination decision.
     
     Contains natural language explanation, quantified uncertainties,
     and counterfactual alternatives for human oversight.
+    
+    Alternatives may be supplied lazily via alternatives_factory; read them
+    through get_alternatives(), which builds and caches them on first use.
     """
     decision_type: DecisionType
     timestamp: int
@@ -78,6 +196,18 @@ class DecisionExplanation:
     chosen_action: str
     expected_outcome: str
     actual_outcome: Optional[str] = None  # Filled after execution
+    # Wall-clock capture time; a cheap integer read, formatted only on export
+    wall_time_ns: int = field(default_factory=time.time_ns, repr=False, compare=False)
+    alternatives_factory: Optional[Callable[[], List[Dict[str, Any]]]] = field(
+        default=None, repr=False, compare=False
+    )
+    
+    def get_alternatives(self) -> List[Dict[str, Any]]:
+        """Counterfactual options, materializing deferred ones on first access."""
+        if self.alternatives_factory is not None:
+            self.alternatives = self.alternatives_factory()
+            self.alternatives_factory = None
+        return self.alternatives
     
     def to_natural_language(self) -> str:
         """
@@ -86,41 +216,56 @@ class DecisionExplanation:
         Returns:
             Natural language explanation suitable for FEMA dashboard display
         """
-        nl_parts = [
-            f"[{self.decision_type.value.upper()}]",
-            self.primary_explanation,
-            f"\nChosen Action: {self.chosen_action}",
-            f"Confidence: {self.confidence}",
-            f"Expected Outcome: {self.expected_outcome}"
-        ]
+        out = io.StringIO()
+        write = out.write
+        
+        write(f"[{self.decision_type.upper()}]\n")
+        write(self.primary_explanation)
+        write(f"\n\nChosen Action: {self.chosen_action}")
+        write(f"\nConfidence: {self.confidence}")
+        write(f"\nExpected Outcome: {self.expected_outcome}")
         
         if self.factors:
-            nl_parts.append("\nKey Factors:")
+            write("\n\nKey Factors:")
             for key, value in self.factors.items():
-                nl_parts.append(f"  - {key}: {value}")
+                write(f"\n  - {key}: {value}")
         
-        if self.alternatives:
-            nl_parts.append(f"\nAlternatives Considered: {len(self.alternatives)}")
-            for i, alt in enumerate(self.alternatives[:3], 1):  # Top 3 alternatives
-                nl_parts.append(f"  {i}. {alt.get('description', 'Unknown')}")
+        alternatives = self.get_alternatives()
+        if alternatives:
+            write(f"\n\nAlternatives Considered: {len(alternatives)}")
+            for i, alt in enumerate(alternatives[:3], 1):  # Top 3 alternatives
+                write(f"\n  {i}. {alt.get('description', 'Unknown')}")
         
-        return "\n".join(nl_parts)
+        return out.getvalue()
     
     def to_dict(self) -> Dict[str, Any]:
         """Export for JSON logging and audit trails."""
         return {
-            "decision_type": self.decision_type.value,
+            "decision_type": self.decision_type,
             "timestamp": self.timestamp,
+            "wall_time": datetime.fromtimestamp(self.wall_time_ns / 1e9, tz=timezone.utc).isoformat(),
             "explanation": self.primary_explanation,
             "confidence": self.confidence.to_dict(),
             "factors": self.factors,
-            "alternatives": self.alternatives,
+            "alternatives": self.get_alternatives(),
             "chosen_action": self.chosen_action,
             "expected_outcome": self.expected_outcome,
             "actual_outcome": self.actual_outcome
         }
 
 
+def _audit_json_default(obj: Any) -> Any:
+    """
+    json encoder hook serializing explanation records on the fly.
+    
+    Lets exports hand the encoder the records themselves, so each record's
+    dict exists only while it is being written instead of all at once.
+    """
+    if isinstance(obj, (DecisionExplanation, ConfidenceInterval)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class CounterfactualReasoner:
     """
     Generates "what-if" scenarios to explain decisions by contrasting
@@ -228,17 +373,30 @@ class ExplanationEngine:
     Patent Core: "Explainable Risk-Aware Task Reallocation System"
     """
     
-    def __init__(self, enable_logging: bool = True):
+    def __init__(
+        self,
+        enable_logging: bool = True,
+        max_history: Optional[int] = 10000,
+        audit_sink: Optional[TextIO] = None
+    ):
         """
         Initialize explainability engine.
         
         Args:
             enable_logging: Whether to maintain audit trail of all explanations
+            max_history: Number of explanations kept in memory (None = unbounded).
+                Older entries are dropped in O(1) once the limit is reached.
+            audit_sink: Optional text stream receiving every explanation as a
+                JSON line when logged, so the full trail survives the bound
         """
         self.counterfactual_reasoner = CounterfactualReasoner()
-        self.explanation_history: List[DecisionExplanation] = []
+        self.explanation_history: Deque[DecisionExplanation] = deque(maxlen=max_history)
         self.enable_logging = enable_logging
+        self.audit_sink = audit_sink
         self.total_decisions = 0
+        
+        # Per-type totals over all logged decisions (not only the retained window)
+        self.decision_type_counts: Counter = Counter()
     
     def explain_mode_switch(
         self,
@@ -262,22 +420,12 @@ class ExplanationEngine:
             Structured explanation with confidence intervals
         """
         # Calculate confidence interval for risk assessment
-        confidence = ConfidenceInterval(
-            mean=avg_risk,
-            lower_bound=max(0, avg_risk - 1.96 * risk_std),
-            upper_bound=min(1, avg_risk + 1.96 * risk_std),
-            std_dev=risk_std
-        )
+        confidence = ConfidenceInterval.from_normal(avg_risk, risk_std, 0, 1)
         
         # Generate natural language explanation
-        if new_mode == "CENTRALIZED":
-            reason = f"Low environmental risk ({avg_risk:.2f}) enables centralized CSP optimization"
-        elif new_mode == "AUCTION":
-            reason = f"Moderate risk ({avg_risk:.2f}) requires distributed auction-based allocation"
-        elif new_mode == "COALITION":
-            reason = f"High risk ({avg_risk:.2f}) necessitates coalition formation for safety"
-        else:
-            reason = f"Risk assessment ({avg_risk:.2f}) triggered mode change"
+        reason = _MODE_REASON_TEMPLATES.get(
+            new_mode, _DEFAULT_MODE_REASON_TEMPLATE
+        ).format(avg_risk)
         
         explanation = DecisionExplanation(
             decision_type=DecisionType.MODE_SWITCH,
@@ -289,8 +437,8 @@ class ExplanationEngine:
                 "risk_std_dev": risk_std,
                 "old_mode": old_mode,
                 "new_mode": new_mode,
-                "decision_threshold_low": 0.3,
-                "decision_threshold_high": 0.7
+                "decision_threshold_low": MODE_THRESHOLD_LOW,
+                "decision_threshold_high": MODE_THRESHOLD_HIGH
             },
             alternatives=[],  # Mode switch is deterministic based on risk
             chosen_action=f"Switch to {new_mode}",
@@ -324,47 +472,39 @@ class ExplanationEngine:
         # Calculate confidence based on bid spread
         bid_values = list(bid_data.values())
         if len(bid_values) > 1:
-            mean_bid = sum(bid_values) / len(bid_values)
-            std_bid = math.sqrt(sum((b - mean_bid)**2 for b in bid_values) / len(bid_values))
+            _, std_bid = _mean_std(bid_values)
         else:
-            mean_bid = bid_values[0] if bid_values else 0
             std_bid = 0
         
         winning_bid = bid_data.get(assigned_agent, 0)
         
-        confidence = ConfidenceInterval(
-            mean=winning_bid,
-            lower_bound=max(0, winning_bid - 1.96 * std_bid),
-            upper_bound=winning_bid + 1.96 * std_bid,
-            std_dev=std_bid
-        )
+        confidence = ConfidenceInterval.from_normal(winning_bid, std_bid, lower_limit=0)
         
-        # Generate alternatives (top 3 losing bids)
-        sorted_bids = sorted(bid_data.items(), key=lambda x: x[1])
-        alternatives = []
-        for agent_id, bid in sorted_bids[1:4]:  # Skip winner, take next 3
-            alternatives.append({
-                "description": f"Assign to Agent {agent_id} (bid: {bid:.2f})",
-                "expected_utility": -bid,  # Lower bid = higher utility
-                "rejection_reason": f"Higher cost by {bid - winning_bid:.2f}",
-                "predicted_outcome": f"Task completed with {bid:.2f} cost"
-            })
+        # Alternatives are the top 3 losing bids; only the 4 lowest bids are
+        # needed, so avoid sorting the whole bidder pool. The alternative
+        # dicts are only built if the explanation is actually inspected.
+        sorted_bids = heapq.nsmallest(4, bid_data.items(), key=lambda x: x[1])
         
         explanation = DecisionExplanation(
             decision_type=DecisionType.TASK_ALLOCATION,
             timestamp=timestamp,
-            primary_explanation=f"Allocated {task_type} task at {task_location} to Agent {assigned_agent} via auction",
+            primary_explanation=_ALLOCATION_EXPLANATION.format(
+                task=task_type, loc=task_location, agent=assigned_agent
+            ),
             confidence=confidence,
             factors={
                 "task_type": task_type,
                 "location": task_location,
                 "winning_bid": winning_bid,
                 "num_bidders": len(bid_data),
-                "bid_spread": std_bid * 1.96  # 95% of values within this range
+                "bid_spread": std_bid * Z_95  # 95% of values within this range
             },
-            alternatives=alternatives,
+            alternatives=[],
             chosen_action=f"Assign to Agent {assigned_agent}",
-            expected_outcome=f"{task_type} completed with minimum cost {winning_bid:.2f}"
+            expected_outcome=f"{task_type} completed with minimum cost {winning_bid:.2f}",
+            alternatives_factory=partial(
+                _auction_alternatives, sorted_bids[1:4], winning_bid  # Skip winner, take next 3
+            )
         )
         
         self._log_explanation(explanation)
@@ -397,9 +537,9 @@ class ExplanationEngine:
         # Confidence interval for risk reduction
         confidence = ConfidenceInterval(
             mean=risk_reduction,
-            lower_bound=max(0, risk_reduction * 0.7),  # Conservative estimate
-            upper_bound=risk_reduction * 1.3,
-            std_dev=risk_reduction * 0.15
+            lower_bound=max(0, risk_reduction * COALITION_LOWER_MULT),  # Conservative estimate
+            upper_bound=risk_reduction * COALITION_UPPER_MULT,
+            std_dev=risk_reduction * COALITION_STD_MULT
         )
         
         # Alternative: agents working alone
@@ -413,7 +553,9 @@ class ExplanationEngine:
         explanation = DecisionExplanation(
             decision_type=DecisionType.COALITION_FORMATION,
             timestamp=timestamp,
-            primary_explanation=f"Formed coalition of {len(coalition_members)} agents to handle high-risk task at {target_location}",
+            primary_explanation=_COALITION_EXPLANATION.format(
+                n=len(coalition_members), loc=target_location
+            ),
             confidence=confidence,
             factors={
                 "coalition_size": len(coalition_members),
@@ -454,9 +596,9 @@ class ExplanationEngine:
         """
         confidence = ConfidenceInterval(
             mean=workload_metric,
-            lower_bound=workload_metric * 0.9,
-            upper_bound=workload_metric * 1.1,
-            std_dev=workload_metric * 0.05
+            lower_bound=workload_metric * SPAWN_LOWER_MULT,
+            upper_bound=workload_metric * SPAWN_UPPER_MULT,
+            std_dev=workload_metric * SPAWN_STD_MULT
         )
         
         explanation = DecisionExplanation(
@@ -488,28 +630,52 @@ class ExplanationEngine:
         if self.enable_logging:
             self.explanation_history.append(explanation)
             self.total_decisions += 1
+            self.decision_type_counts[explanation.decision_type] += 1
+            
+            if self.audit_sink is not None:
+                self.audit_sink.write(json.dumps(explanation.to_dict()))
+                self.audit_sink.write("\n")
     
     def get_recent_explanations(self, count: int = 10) -> List[DecisionExplanation]:
         """Retrieve most recent explanations for dashboard display."""
-        return self.explanation_history[-count:]
+        start = max(len(self.explanation_history) - count, 0)
+        return list(islice(self.explanation_history, start, None))
     
     def export_audit_trail(self, filepath: str):
         """
-        Export complete audit trail for regulatory compliance.
+        Export audit trail for regulatory compliance.
+        
+        Contains the explanations retained in memory (the last max_history);
+        use audit_sink to capture every decision of very long runs.
         
         Args:
             filepath: Path to save JSON audit trail
         """
-        import json
-        
         audit_data = {
             "total_decisions": self.total_decisions,
             "export_timestamp": datetime.now().isoformat(),
-            "explanations": [exp.to_dict() for exp in self.explanation_history]
+            "explanations": list(self.explanation_history)
         }
         
         with open(filepath, 'w') as f:
-            json.dump(audit_data, f, indent=2)
+            json.dump(audit_data, f, indent=2, default=_audit_json_default)
+    
+    def export_audit_trail_jsonl(self, filepath: str):
+        """
+        Stream audit trail as JSON Lines (one explanation per line).
+        
+        Args:
+            filepath: Path to save JSONL audit trail
+        
+        Rationale:
+            Each record is encoded and written on its own, so memory stays
+            constant in the length of the history, and compact one-shot
+            json.dumps uses the C encoder (indented output does not).
+        """
+        with open(filepath, 'w') as f:
+            for exp in self.explanation_history:
+                f.write(json.dumps(exp.to_dict()))
+                f.write("\n")
     
     def generate_summary_report(self) -> str:
         """
@@ -522,10 +688,7 @@ class ExplanationEngine:
             return "No decisions recorded."
         
         # Count decisions by type
-        type_counts = {}
-        for exp in self.explanation_history:
-            type_name = exp.decision_type.value
-            type_counts[type_name] = type_counts.get(type_name, 0) + 1
+        type_counts = self.decision_type_counts
         
         report_lines = [
             "="*60,
@@ -536,8 +699,8 @@ class ExplanationEngine:
             "Decisions by Type:"
         ]
         
-        for decision_type, count in sorted(type_counts.items()):
-            report_lines.append(f"  {decision_type}: {count}")
+        for type_name, count in sorted(type_counts.items()):
+            report_lines.append(f"  {type_name}: {count}")
         
         report_lines.extend([
             "",
@@ -545,7 +708,7 @@ class ExplanationEngine:
             "-"*60
         ])
         
-        for exp in self.explanation_history[-5:]:
+        for exp in self.get_recent_explanations(5):
             report_lines.append(f"[T={exp.timestamp}] {exp.primary_explanation}")
             report_lines.append(f"  Confidence: {exp.confidence}")
             report_lines.append("")
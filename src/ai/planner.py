@@ -11,12 +11,28 @@ Classical AI Planning:
 This is NOT a general-purpose planner - it's domain-specific for disaster rescue.
 """
 
-from typing import List, Tuple, Optional, Dict, Any, Set
+from typing import List, Tuple, Optional, Dict, Any, Callable, FrozenSet, Sequence
 from dataclasses import dataclass
 from ..utils.config import ActionType, AI
+from ..utils.compat import DATACLASS_SLOTS
 
 
-@dataclass
+def _nearest_position(
+    origin: Tuple[int, int],
+    candidates: Sequence[Tuple[int, int]]
+) -> Tuple[int, int]:
+    """
+    Return the candidate with the smallest Manhattan distance to origin.
+    
+    Ties go to the earliest candidate, as with min(). Distances are built in
+    one list comprehension rather than a key-function call per candidate.
+    """
+    ox, oy = origin
+    distances = [abs(cx - ox) + abs(cy - oy) for cx, cy in candidates]
+    return candidates[distances.index(min(distances))]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class State:
     """
     World state representation for planning.
@@ -24,23 +40,34 @@ class State:
     Attributes:
         agent_pos: Agent's (x, y) position
         agent_carrying: Is agent carrying a survivor?
-        survivor_positions: Set of survivor locations
-        safe_zone_positions: Set of safe zone locations
+        survivor_positions: Frozen set of survivor locations
+        safe_zone_positions: Frozen set of safe zone locations
         goal_achieved: Planning goal status
+        
+    Position sets are stored as frozensets: copies share them instead of
+    duplicating them, and frozensets cache their own hash. Effects that
+    change survivors build a new frozenset rather than mutating in place.
     """
     agent_pos: Tuple[int, int]
     agent_carrying: bool
-    survivor_positions: Set[Tuple[int, int]]
-    safe_zone_positions: Set[Tuple[int, int]]
+    survivor_positions: FrozenSet[Tuple[int, int]]
+    safe_zone_positions: FrozenSet[Tuple[int, int]]
     goal_achieved: bool = False
     
+    def __post_init__(self):
+        # Accept any iterable of positions (e.g. the grid's live sets)
+        if not isinstance(self.survivor_positions, frozenset):
+            self.survivor_positions = frozenset(self.survivor_positions)
+        if not isinstance(self.safe_zone_positions, frozenset):
+            self.safe_zone_positions = frozenset(self.safe_zone_positions)
+    
     def copy(self) -> 'State':
-        """Create a copy of this state."""
+        """Create a copy of this state (position sets are shared)."""
         return State(
             agent_pos=self.agent_pos,
             agent_carrying=self.agent_carrying,
-            survivor_positions=set(self.survivor_positions),
-            safe_zone_positions=set(self.safe_zone_positions),
+            survivor_positions=self.survivor_positions,
+            safe_zone_positions=self.safe_zone_positions,
             goal_achieved=self.goal_achieved
         )
     
@@ -48,17 +75,18 @@ class State:
         return hash((
             self.agent_pos,
             self.agent_carrying,
-            frozenset(self.survivor_positions),
-            frozenset(self.safe_zone_positions)
+            self.survivor_positions,
+            self.safe_zone_positions
         ))
     
     def __eq__(self, other):
         return (self.agent_pos == other.agent_pos and
                 self.agent_carrying == other.agent_carrying and
-                self.survivor_positions == other.survivor_positions)
+                (self.survivor_positions is other.survivor_positions or
+                 self.survivor_positions == other.survivor_positions))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Action:
     """
     STRIPS action schema.
@@ -119,8 +147,9 @@ class STRIPSPlanner:
         self,
         agent_pos: Tuple[int, int],
         survivor_pos: Tuple[int, int],
-        safe_zones: List[Tuple[int, int]],
-        pathfinder
+        safe_zones: Sequence[Tuple[int, int]],
+        pathfinder: Optional[Callable] = None,
+        path_version: Optional[int] = None
     ) -> List[Action]:
         """
         Generate plan to rescue a specific survivor.
@@ -129,7 +158,10 @@ class STRIPSPlanner:
             agent_pos: Agent's current position
             survivor_pos: Target survivor position
             safe_zones: Available safe zones
-            pathfinder: Function to compute paths
+            pathfinder: Optional multi-goal search (start, goals) ->
+                        (best_goal, path, cost), e.g. find_nearest_goal
+                        bound to the agent's cost model
+            path_version: Grid version the pathfinder searched against
             
         Returns:
             List of actions to complete rescue
@@ -139,6 +171,13 @@ class STRIPSPlanner:
         2. PICKUP survivor
         3. TRANSPORT to nearest safe zone
         4. DROP survivor
+        
+        With a pathfinder, "nearest" is the zone its risk-weighted search
+        reaches first from the survivor (usually, not provably, the
+        cheapest), and the TRANSPORT action carries that path stamped with
+        path_version; execution reuses it only if the grid has not changed
+        since. Without one (or if no zone is reachable) the Manhattan-nearest
+        zone is used and the path is left to execution.
         """
         plan: List[Action] = []
         
@@ -163,14 +202,17 @@ class STRIPSPlanner:
         
         # Step 3: Transport to safe zone
         # Choose nearest safe zone
-        nearest_safe_zone = min(
-            safe_zones,
-            key=lambda sz: self._manhattan_distance(survivor_pos, sz)
-        )
+        nearest_safe_zone, transport_path = None, None
+        if pathfinder is not None:
+            nearest_safe_zone, transport_path, _ = pathfinder(survivor_pos, safe_zones)
+        if nearest_safe_zone is None:
+            nearest_safe_zone = _nearest_position(survivor_pos, safe_zones)
+            transport_path = None
         
         plan.append(Action(
             type=ActionType.TRANSPORT,
-            parameters={'target': nearest_safe_zone, 'path': None},
+            parameters={'target': nearest_safe_zone, 'path': transport_path,
+                        'path_version': path_version},
             preconditions=[f"At {survivor_pos}", "Carrying survivor"],
             effects=[f"Agent at {nearest_safe_zone}"],
             cost=self._estimate_move_cost(survivor_pos, nearest_safe_zone)
@@ -208,10 +250,7 @@ class STRIPSPlanner:
             return []
         
         # Choose nearest unexplored cell
-        target = min(
-            unexplored_targets,
-            key=lambda t: self._manhattan_distance(agent_pos, t)
-        )
+        target = _nearest_position(agent_pos, unexplored_targets)
         
         plan = [Action(
             type=ActionType.EXPLORE,
@@ -254,7 +293,7 @@ class STRIPSPlanner:
         self,
         current_plan: List[Action],
         current_pos: Tuple[int, int],
-        current_state: Dict,
+        grid,
         blocked_steps: int
     ) -> Tuple[bool, str]:
         """
@@ -263,7 +302,7 @@ class STRIPSPlanner:
         Args:
             current_plan: Active plan
             current_pos: Agent's current position
-            current_state: Current world state
+            grid: Environment grid (live survivor state)
             blocked_steps: Number of consecutive blocked steps
             
         Returns:
@@ -286,7 +325,7 @@ class STRIPSPlanner:
         
         if first_action.type == ActionType.PICKUP:
             target_pos = first_action.parameters['position']
-            if target_pos not in current_state.get('survivor_positions', set()):
+            if not grid.has_survivor_at(target_pos[0], target_pos[1]):
                 return True, f"Survivor no longer at {target_pos}"
         
         return False, ""
@@ -12,39 +12,10 @@ This is stateless - takes grid state as input, returns path.
 """
 
 import heapq
-from typing import List, Tuple, Optional, Callable, Set, Dict
-from ..utils.config import AI
-
-
-class AStarNode:
-    """
-    A* search node with cost tracking.
-    
-    Attributes:
-        position: (x, y) coordinates
-        g_cost: Actual cost from start to this node
-        h_cost: Heuristic estimated cost to goal
-        f_cost: Total cost (g + h)
-        parent: Previous node in path
-    """
-    
-    def __init__(self, position: Tuple[int, int], g_cost: float, h_cost: float, 
-                 parent: Optional['AStarNode'] = None):
-        self.position = position
-        self.g_cost = g_cost
-        self.h_cost = h_cost
-        self.f_cost = g_cost + h_cost
-        self.parent = parent
-    
-    def __lt__(self, other: 'AStarNode') -> bool:
-        """Comparison for priority queue (lower f_cost = higher priority)."""
-        return self.f_cost < other.f_cost
-    
-    def __eq__(self, other: 'AStarNode') -> bool:
-        return self.position == other.position
-    
-    def __hash__(self):
-        return hash(self.position)
+import math
+from functools import partial
+from typing import List, Tuple, Optional, Callable, Collection, Sequence, Set, Dict
+from ..utils.config import AI, CellFlag
 
 
 def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
@@ -67,14 +38,14 @@ def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
 
 def euclidean_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
     """Calculate Euclidean distance (for diagonal movement)."""
-    return ((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)**0.5
+    return math.hypot(pos1[0] - pos2[0], pos1[1] - pos2[1])
 
 
 def astar_search(
     start: Tuple[int, int],
     goal: Tuple[int, int],
     is_passable: Callable[[int, int], bool],
-    get_neighbors: Callable[[int, int], List[Tuple[int, int]]],
+    get_neighbors: Callable[[int, int], Sequence[Tuple[int, int]]],
     get_terrain_cost: Callable[[int, int], float],
     get_risk_cost: Callable[[int, int], float],
     heuristic: str = "manhattan"
@@ -116,90 +87,142 @@ def astar_search(
     if not is_passable(goal[0], goal[1]):
         return [], float('inf')
     
-    # Choose heuristic function
-    heuristic_func = euclidean_distance if heuristic == "euclidean" else manhattan_distance
+    # Choose heuristic function (None = Manhattan, inlined by the core)
+    estimate = partial(euclidean_distance, pos2=goal) if heuristic == "euclidean" else None
     
-    # Initialize data structures
-    open_set: List[AStarNode] = []
+    _, path, cost = _astar_core(
+        start, (goal,), estimate,
+        is_passable, get_neighbors, get_terrain_cost, get_risk_cost
+    )
+    return path, cost
+
+
+def _astar_core(
+    start: Tuple[int, int],
+    goals: Collection[Tuple[int, int]],
+    estimate: Optional[Callable[[Tuple[int, int]], float]],
+    is_passable: Callable[[int, int], bool],
+    get_neighbors: Callable[[int, int], Sequence[Tuple[int, int]]],
+    get_terrain_cost: Callable[[int, int], float],
+    get_risk_cost: Callable[[int, int], float]
+) -> Tuple[Optional[Tuple[int, int]], List[Tuple[int, int]], float]:
+    """
+    Shared A* loop for single- and multi-goal searches.
+    
+    The search stops at the first goal popped from the open set. The
+    heuristic is scaled by the neighbour's risk, so it can overestimate:
+    the returned path and goal are good but not guaranteed cheapest, and
+    with several goals the one reached may differ from the best of one
+    search per goal. Inputs are assumed validated by the caller.
+    
+    Args:
+        start: Starting position
+        goals: Goal positions (a set for multi-goal searches)
+        estimate: Base heuristic from a position to the nearest goal, or
+                  None for Manhattan distance to the single goal (computed
+                  inline, saving a function call per push)
+        (other args same as astar_search)
+        
+    Returns:
+        Tuple of (goal_reached, path, cost), or (None, [], inf)
+    """
+    # Bind hot-loop lookups to locals; the loop below runs once per expansion
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    risk_multiplier = AI.ASTAR_RISK_PENALTY_MULTIPLIER
+    risk_weight = AI.ASTAR_HEURISTIC_RISK_WEIGHT
+    if estimate is None:
+        (goal_x, goal_y), = goals
+        start_h = abs(start[0] - goal_x) + abs(start[1] - goal_y)
+    else:
+        start_h = estimate(start)
+    
+    # Initialize data structures. Open-set entries are plain tuples
+    # (f_cost, push_order, g_cost, position): tuple comparison runs in C and
+    # push_order breaks f ties first-in-first-out without comparing positions.
+    open_set: List[Tuple[float, int, float, Tuple[int, int]]] = []
     closed_set: Set[Tuple[int, int]] = set()
     g_costs: Dict[Tuple[int, int], float] = {start: 0.0}
+    parent_of: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+    push_order = 0
     
     # Add start node
-    start_h = heuristic_func(start, goal)
-    start_node = AStarNode(start, 0.0, start_h, None)
-    heapq.heappush(open_set, start_node)
+    heappush(open_set, (start_h, push_order, 0.0, start))
     
     # Main search loop
     while open_set:
         # Get node with lowest f_cost
-        current = heapq.heappop(open_set)
+        _, _, current_g, current_pos = heappop(open_set)
         
         # Check if goal reached
-        if current.position == goal:
-            return _reconstruct_path(current), current.g_cost
+        if current_pos in goals:
+            return current_pos, _reconstruct_path(parent_of, current_pos), current_g
         
         # Skip if already processed
-        if current.position in closed_set:
+        if current_pos in closed_set:
             continue
         
         # Mark as processed
-        closed_set.add(current.position)
+        closed_set.add(current_pos)
+        step_g = current_g + 1.0  # Base movement cost
         
         # Expand neighbors
-        neighbors = get_neighbors(current.position[0], current.position[1])
-        
-        for neighbor_pos in neighbors:
+        for neighbor_pos in get_neighbors(current_pos[0], current_pos[1]):
+            # Skip if already processed
+            if neighbor_pos in closed_set:
+                continue
+            
             nx, ny = neighbor_pos
             
             # Skip impassable cells
             if not is_passable(nx, ny):
                 continue
             
-            # Skip if already processed
-            if neighbor_pos in closed_set:
-                continue
-            
-            # Calculate costs
-            step_cost = 1.0  # Base movement cost
-            terrain_cost = get_terrain_cost(nx, ny)
+            # Total cost to reach this neighbor (risk is reused by the heuristic)
             risk_cost = get_risk_cost(nx, ny)
-            
-            # Total cost to reach this neighbor
-            tentative_g = current.g_cost + step_cost + terrain_cost + risk_cost
+            tentative_g = step_g + get_terrain_cost(nx, ny) + risk_cost
             
             # Check if this is a better path
-            if neighbor_pos not in g_costs or tentative_g < g_costs[neighbor_pos]:
+            known_g = g_costs.get(neighbor_pos)
+            if known_g is None or tentative_g < known_g:
                 g_costs[neighbor_pos] = tentative_g
+                parent_of[neighbor_pos] = current_pos
                 
                 # Calculate heuristic with risk weighting
-                base_h = heuristic_func(neighbor_pos, goal)
-                risk_factor = get_risk_cost(nx, ny) / AI.ASTAR_RISK_PENALTY_MULTIPLIER
-                h_cost = base_h * (1.0 + AI.ASTAR_HEURISTIC_RISK_WEIGHT * risk_factor)
+                if estimate is None:
+                    base_h = abs(nx - goal_x) + abs(ny - goal_y)
+                else:
+                    base_h = estimate(neighbor_pos)
+                h_cost = base_h * (1.0 + risk_weight * (risk_cost / risk_multiplier))
                 
-                # Create and add neighbor node
-                neighbor_node = AStarNode(neighbor_pos, tentative_g, h_cost, current)
-                heapq.heappush(open_set, neighbor_node)
+                push_order += 1
+                heappush(open_set, (tentative_g + h_cost, push_order, tentative_g, neighbor_pos))
     
     # No path found
-    return [], float('inf')
+    return None, [], float('inf')
 
 
-def _reconstruct_path(node: AStarNode) -> List[Tuple[int, int]]:
+def _reconstruct_path(
+    parent_of: Dict[Tuple[int, int], Optional[Tuple[int, int]]],
+    goal: Tuple[int, int]
+) -> List[Tuple[int, int]]:
     """
-    Reconstruct path from goal to start via parent pointers.
+    Reconstruct path from goal to start via recorded parents.
     
     Args:
-        node: Goal node with parent chain
+        parent_of: Best-known predecessor of each reached position
+                   (the start maps to None)
+        goal: Goal position
         
     Returns:
         List of positions from start to goal
     """
     path = []
-    current = node
+    current = goal
     
     while current is not None:
-        path.append(current.position)
-        current = current.parent
+        path.append(current)
+        current = parent_of[current]
     
     # Reverse to get start-to-goal order
     path.reverse()
@@ -228,6 +251,59 @@ def compute_terrain_cost(cell) -> float:
     return 0.0
 
 
+def build_terrain_cost_lut(fire_penalty: float = 0.0, debris_penalty: float = 0.0) -> Tuple[float, ...]:
+    """
+    Tabulate terrain cost for every CellFlag byte.
+    
+    Args:
+        fire_penalty: Extra cost for entering a burning cell
+        debris_penalty: Extra cost (on top of the debris terrain penalty)
+                        for entering a debris cell
+        
+    Returns:
+        256-entry tuple indexed by Grid.flags values
+        
+    Rationale:
+        compute_terrain_cost plus the agents' hazard surcharges is a chain
+        of flag branches evaluated for every neighbour expansion; indexing a
+        precomputed table is a single lookup.
+    """
+    lut = []
+    for bits in range(256):
+        if bits & CellFlag.DEBRIS:
+            cost = AI.ASTAR_TERRAIN_PENALTY_DEBRIS
+        elif bits & CellFlag.FLOOD:
+            cost = AI.ASTAR_TERRAIN_PENALTY_FLOOD
+        else:
+            cost = 0.0
+        if bits & CellFlag.FIRE:
+            cost += fire_penalty
+        if bits & CellFlag.DEBRIS:
+            cost += debris_penalty
+        lut.append(cost)
+    return tuple(lut)
+
+
+TERRAIN_COST_LUT = build_terrain_cost_lut()
+
+
+def compute_terrain_cost_at(grid, x: int, y: int) -> float:
+    """
+    Calculate terrain penalty for grid position (x, y).
+    
+    Same penalties as compute_terrain_cost, looked up from the grid's packed
+    cell flags so callers in the A* loop skip the Cell lookup.
+    
+    Args:
+        grid: Environment grid
+        x, y: In-bounds cell coordinates
+        
+    Returns:
+        Penalty value (0 = no penalty, higher = more difficult)
+    """
+    return TERRAIN_COST_LUT[grid.flags[x * grid.height + y]]
+
+
 def compute_risk_cost(risk_value: float) -> float:
     """
     Calculate risk penalty from probability estimate.
@@ -245,11 +321,20 @@ def compute_risk_cost(risk_value: float) -> float:
     return risk_value * AI.ASTAR_RISK_PENALTY_MULTIPLIER
 
 
+def _nearest_goal_distance(
+    goal_set: Set[Tuple[int, int]],
+    pos: Tuple[int, int]
+) -> float:
+    """Manhattan distance from pos to the closest goal in goal_set."""
+    x, y = pos
+    return min(abs(x - gx) + abs(y - gy) for gx, gy in goal_set)
+
+
 def find_nearest_goal(
     start: Tuple[int, int],
     goals: List[Tuple[int, int]],
     is_passable: Callable[[int, int], bool],
-    get_neighbors: Callable[[int, int], List[Tuple[int, int]]],
+    get_neighbors: Callable[[int, int], Sequence[Tuple[int, int]]],
     get_terrain_cost: Callable[[int, int], float],
     get_risk_cost: Callable[[int, int], float]
 ) -> Tuple[Optional[Tuple[int, int]], List[Tuple[int, int]], float]:
@@ -267,21 +352,25 @@ def find_nearest_goal(
         
     Rationale:
         Agents often have multiple possible targets (survivors, safe zones)
-        This finds the optimal choice considering both distance and risk
+        This picks a cheap one considering both distance and risk.
+        A single search toward the nearest goal (heuristic = Manhattan
+        distance to the closest goal) replaces one A* run per goal, so the
+        region around the start is expanded once. The risk-weighted
+        heuristic is not admissible, so the goal returned is the first one
+        the search reaches, not necessarily the cheapest of all goals.
     """
-    best_goal = None
-    best_path = []
-    best_cost = float('inf')
+    if not goals or not is_passable(start[0], start[1]):
+        return None, [], float('inf')
     
-    for goal in goals:
-        path, cost = astar_search(
-            start, goal, is_passable, get_neighbors,
-            get_terrain_cost, get_risk_cost
-        )
-        
-        if path and cost < best_cost:
-            best_goal = goal
-            best_path = path
-            best_cost = cost
+    # Impassable goals are filtered out here, so they never reach the heuristic
+    goal_set = {goal for goal in goals if is_passable(goal[0], goal[1])}
+    if not goal_set:
+        return None, [], float('inf')
+    
+    # Single goal: the core inlines Manhattan distance
+    estimate = None if len(goal_set) == 1 else partial(_nearest_goal_distance, goal_set)
     
-    return best_goal, best_path, best_cost
+    return _astar_core(
+        start, goal_set, estimate,
+        is_passable, get_neighbors, get_terrain_cost, get_risk_cost
+    )
@@ -5,8 +5,15 @@ No agent logic - purely environmental state and dynamics.
 """
 
 import random
-from typing import List, Tuple, Set, Optional, Dict
-from ..utils.config import GRID, HAZARD, CellType
+from typing import List, Tuple, Set, Optional, Dict, Iterable, Sequence
+from ..utils.config import GRID, HAZARD, CellType, CellFlag
+
+# Neighbour offsets: cardinal first, then diagonals
+_CARDINAL_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_ALL_DIRECTIONS = _CARDINAL_DIRECTIONS + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+# PASSABLE_LUT[flags] is 1 when a cell with those flags can be entered
+PASSABLE_LUT = bytes(0 if b & CellFlag.BLOCKING else 1 for b in range(256))
 
 
 class Cell:
@@ -25,6 +32,12 @@ class Cell:
         explored: Boolean for tracking exploration state
     """
     
+    # One Cell per grid square: slots keep the W x H instances compact
+    __slots__ = (
+        'x', 'y', 'terrain_type', 'has_fire', 'has_flood', 'has_debris',
+        'has_survivor', 'is_safe_zone', 'explored',
+    )
+    
     def __init__(self, x: int, y: int):
         self.x: int = x
         self.y: int = y
@@ -108,6 +121,17 @@ class Grid:
         self.height: int = height
         self.timestep: int = 0
         
+        # Bumped whenever hazards or safe zones change, i.e. whenever path
+        # costs may have changed; consumers compare it to invalidate caches
+        self.version: int = 0
+        # Bumped only when safe zones change (the grid's fixed layout), so
+        # layout-derived caches survive hazard updates
+        self.structural_version: int = 0
+        self._safe_zones_snapshot: Tuple[int, Tuple[Tuple[int, int], ...]] = (-1, ())
+        # Bumped when a survivor is placed or removed
+        self.survivors_version: int = 0
+        self._survivors_snapshot: Tuple[int, Tuple[Tuple[int, int], ...]] = (-1, ())
+        
         if seed is not None:
             random.seed(seed)
         
@@ -124,6 +148,22 @@ class Grid:
         self.flood_positions: Set[Tuple[int, int]] = set()
         self.debris_positions: Set[Tuple[int, int]] = set()
         
+        # Packed CellFlag bits per cell (index = x * height + y) mirroring the
+        # Cell booleans. Pathfinding callbacks read these instead of chasing
+        # Cell attributes, and table lookups on them replace flag branches.
+        self.flags: bytearray = bytearray(width * height)
+        
+        # Neighbour tables (same indexing), so lookups in hot loops skip
+        # the bounds checks and list building
+        self._neighbors_cardinal: List[Tuple[Tuple[int, int], ...]] = [
+            self._compute_neighbors(x, y, _CARDINAL_DIRECTIONS)
+            for x in range(width) for y in range(height)
+        ]
+        self._neighbors_all: List[Tuple[Tuple[int, int], ...]] = [
+            self._compute_neighbors(x, y, _ALL_DIRECTIONS)
+            for x in range(width) for y in range(height)
+        ]
+        
     def get_cell(self, x: int, y: int) -> Optional[Cell]:
         """
         Safely retrieve cell at coordinates.
@@ -143,7 +183,28 @@ class Grid:
         """Check if coordinates are within grid bounds."""
         return 0 <= x < self.width and 0 <= y < self.height
     
-    def get_neighbors(self, x: int, y: int, diagonal: bool = False) -> List[Tuple[int, int]]:
+    def index(self, x: int, y: int) -> int:
+        """Flat index of (x, y) into flags and the neighbour tables."""
+        return x * self.height + y
+    
+    def is_passable(self, x: int, y: int) -> bool:
+        """
+        Flag-backed equivalent of get_cell(x, y).is_passable().
+        
+        Returns:
+            False for out-of-bounds coordinates, fire or debris
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return PASSABLE_LUT[self.flags[x * self.height + y]] == 1
+        return False
+    
+    def has_survivor_at(self, x: int, y: int) -> bool:
+        """Flag-backed survivor test; False for out-of-bounds coordinates."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.flags[x * self.height + y] & CellFlag.SURVIVOR)
+        return False
+    
+    def get_neighbors(self, x: int, y: int, diagonal: bool = False) -> Sequence[Tuple[int, int]]:
         """
         Get valid neighboring cell coordinates.
         
@@ -153,23 +214,22 @@ class Grid:
             diagonal: Include diagonal neighbors
             
         Returns:
-            List of (x, y) tuples for valid neighbors
+            Sequence of (x, y) tuples for valid neighbors. For in-bounds
+            coordinates this is a shared precomputed tuple - do not mutate.
         """
-        neighbors = []
-        
-        # Cardinal directions
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        # Add diagonal directions if requested
-        if diagonal:
-            directions.extend([(-1, -1), (-1, 1), (1, -1), (1, 1)])
-        
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if self.is_valid_position(nx, ny):
-                neighbors.append((nx, ny))
-        
-        return neighbors
+        if 0 <= x < self.width and 0 <= y < self.height:
+            table = self._neighbors_all if diagonal else self._neighbors_cardinal
+            return table[x * self.height + y]
+        return self._compute_neighbors(x, y, _ALL_DIRECTIONS if diagonal else _CARDINAL_DIRECTIONS)
+    
+    def _compute_neighbors(
+        self, x: int, y: int, directions: Tuple[Tuple[int, int], ...]
+    ) -> Tuple[Tuple[int, int], ...]:
+        """In-bounds (x + dx, y + dy) for each direction, in order."""
+        return tuple(
+            (x + dx, y + dy) for dx, dy in directions
+            if 0 <= x + dx < self.width and 0 <= y + dy < self.height
+        )
     
     def add_fire(self, x: int, y: int) -> bool:
         """
@@ -181,68 +241,174 @@ class Grid:
         Returns:
             True if fire was added successfully
         """
-        cell = self.get_cell(x, y)
-        if cell and not cell.has_flood:  # Fire cannot exist in flooded cells
-            cell.has_fire = True
-            self.fire_positions.add((x, y))
-            return True
-        return False
+        return self.add_fires(((x, y),)) == 1
     
     def add_flood(self, x: int, y: int) -> bool:
         """Add flood to a cell, extinguishing any fire."""
-        cell = self.get_cell(x, y)
-        if cell:
-            if cell.has_fire:
-                self.remove_fire(x, y)
-            cell.has_flood = True
-            self.flood_positions.add((x, y))
-            return True
-        return False
+        return self.add_floods(((x, y),)) == 1
     
     def add_debris(self, x: int, y: int) -> bool:
         """Add debris/collapse to a cell."""
-        cell = self.get_cell(x, y)
-        if cell and not cell.has_survivor and not cell.is_safe_zone:
-            cell.has_debris = True
-            self.debris_positions.add((x, y))
-            return True
-        return False
+        return self.add_debris_cells(((x, y),)) == 1
     
     def add_survivor(self, x: int, y: int) -> bool:
         """Place a survivor at coordinates."""
-        cell = self.get_cell(x, y)
-        if cell and not cell.has_debris and not cell.has_fire:
-            cell.has_survivor = True
-            self.survivor_positions.add((x, y))
-            return True
-        return False
+        return self.add_survivors(((x, y),)) == 1
     
     def add_safe_zone(self, x: int, y: int) -> bool:
         """Designate a cell as a safe evacuation zone."""
-        cell = self.get_cell(x, y)
-        if cell:
-            cell.is_safe_zone = True
-            self.safe_zone_positions.add((x, y))
-            # Safe zones are always passable
-            cell.has_debris = False
-            cell.has_fire = False
-            cell.has_flood = False
-            return True
-        return False
+        return self.add_safe_zones(((x, y),)) == 1
+    
+    def add_fires(self, positions: Iterable[Tuple[int, int]]) -> int:
+        """
+        Add fire to each cell in positions (see add_fire).
+        
+        Args:
+            positions: (x, y) coordinates
+            
+        Returns:
+            Number of fires added
+        
+        The bulk setters bind the grid state once and bump the version
+        counters once per call instead of once per cell.
+        """
+        cells, flags, height = self.cells, self.flags, self.height
+        added = 0
+        for x, y in positions:
+            if 0 <= x < self.width and 0 <= y < height:
+                cell = cells[x][y]
+                if not cell.has_flood:  # Fire cannot exist in flooded cells
+                    cell.has_fire = True
+                    flags[x * height + y] |= CellFlag.FIRE
+                    self.fire_positions.add((x, y))
+                    added += 1
+        if added:
+            self.version += 1
+        return added
+    
+    def add_floods(self, positions: Iterable[Tuple[int, int]]) -> int:
+        """Add flood to each cell in positions, extinguishing any fire."""
+        cells, flags, height = self.cells, self.flags, self.height
+        added = 0
+        for x, y in positions:
+            if 0 <= x < self.width and 0 <= y < height:
+                cell = cells[x][y]
+                if cell.has_fire:
+                    cell.has_fire = False
+                    flags[x * height + y] &= ~CellFlag.FIRE
+                    self.fire_positions.discard((x, y))
+                cell.has_flood = True
+                flags[x * height + y] |= CellFlag.FLOOD
+                self.flood_positions.add((x, y))
+                added += 1
+        if added:
+            self.version += 1
+        return added
+    
+    def add_debris_cells(self, positions: Iterable[Tuple[int, int]]) -> int:
+        """Add debris/collapse to each cell in positions."""
+        cells, flags, height = self.cells, self.flags, self.height
+        added = 0
+        for x, y in positions:
+            if 0 <= x < self.width and 0 <= y < height:
+                cell = cells[x][y]
+                if not cell.has_survivor and not cell.is_safe_zone:
+                    cell.has_debris = True
+                    flags[x * height + y] |= CellFlag.DEBRIS
+                    self.debris_positions.add((x, y))
+                    added += 1
+        if added:
+            self.version += 1
+        return added
+    
+    def add_survivors(self, positions: Iterable[Tuple[int, int]]) -> int:
+        """Place a survivor at each of positions."""
+        cells, flags, height = self.cells, self.flags, self.height
+        added = 0
+        for x, y in positions:
+            if 0 <= x < self.width and 0 <= y < height:
+                cell = cells[x][y]
+                if not cell.has_debris and not cell.has_fire:
+                    cell.has_survivor = True
+                    flags[x * height + y] |= CellFlag.SURVIVOR
+                    self.survivor_positions.add((x, y))
+                    added += 1
+        if added:
+            self.survivors_version += 1
+        return added
+    
+    def add_safe_zones(self, positions: Iterable[Tuple[int, int]]) -> int:
+        """Designate each of positions as a safe evacuation zone."""
+        cells, flags, height = self.cells, self.flags, self.height
+        cleared = ~(CellFlag.FIRE | CellFlag.FLOOD | CellFlag.DEBRIS)
+        added = 0
+        for x, y in positions:
+            if 0 <= x < self.width and 0 <= y < height:
+                cell = cells[x][y]
+                cell.is_safe_zone = True
+                self.safe_zone_positions.add((x, y))
+                # Safe zones are always passable
+                cell.has_debris = False
+                cell.has_fire = False
+                cell.has_flood = False
+                i = x * height + y
+                flags[i] = (flags[i] | CellFlag.SAFE_ZONE) & cleared
+                added += 1
+        if added:
+            self.version += 1
+            self.structural_version += 1
+        return added
+    
+    def get_safe_zones(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Snapshot of safe zone positions.
+        
+        Returns:
+            Tuple in safe_zone_positions iteration order, rebuilt only when
+            structural_version changes (callers share it - do not mutate)
+        """
+        version, zones = self._safe_zones_snapshot
+        if version != self.structural_version:
+            zones = tuple(self.safe_zone_positions)
+            self._safe_zones_snapshot = (self.structural_version, zones)
+        return zones
+    
+    def get_survivors(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        Snapshot of survivor positions.
+        
+        Returns:
+            Tuple in survivor_positions iteration order, rebuilt only when
+            survivors_version changes (callers share it - do not mutate)
+        """
+        version, survivors = self._survivors_snapshot
+        if version != self.survivors_version:
+            survivors = tuple(self.survivor_positions)
+            self._survivors_snapshot = (self.survivors_version, survivors)
+        return survivors
+    
+    @property
+    def survivor_count(self) -> int:
+        """Number of survivors still on the grid (no summary dict built)."""
+        return len(self.survivor_positions)
     
     def remove_fire(self, x: int, y: int):
         """Remove fire from a cell."""
         cell = self.get_cell(x, y)
         if cell and cell.has_fire:
             cell.has_fire = False
+            self.flags[x * self.height + y] &= ~CellFlag.FIRE
             self.fire_positions.discard((x, y))
+            self.version += 1
     
     def remove_survivor(self, x: int, y: int):
         """Remove survivor from a cell (rescued)."""
         cell = self.get_cell(x, y)
         if cell and cell.has_survivor:
             cell.has_survivor = False
+            self.flags[x * self.height + y] &= ~CellFlag.SURVIVOR
             self.survivor_positions.discard((x, y))
+            self.survivors_version += 1
     
     def propagate_hazards(self):
         """
@@ -284,6 +450,7 @@ class Grid:
                     # Spread with low probability
                     if random.random() < HAZARD.FIRE_SPREAD_RATE * 0.3:  # Reduced further
                         cell.has_fire = True
+                        self.flags[nx * self.height + ny] |= CellFlag.FIRE
                         new_fires.add((nx, ny))
         
         self.fire_positions.update(new_fires)
@@ -297,10 +464,14 @@ class Grid:
                 if cell and not cell.has_flood and not cell.has_fire:
                     if random.random() < HAZARD.FLOOD_SPREAD_RATE * 0.2:
                         cell.has_flood = True
+                        self.flags[nx * self.height + ny] |= CellFlag.FLOOD
                         new_floods.add((nx, ny))
         
         self.flood_positions.update(new_floods)
         
+        if new_fires or new_floods:
+            self.version += 1
+        
         self.timestep += 1
     
     def get_grid_state_summary(self) -> Dict:
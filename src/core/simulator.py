@@ -28,12 +28,25 @@ from ..ai.csp_allocator import CSPAllocator
 from ..ai.coordinator import HybridCoordinator, CoordinationMode
 from ..ai.communication import CommunicationNetwork
 from ..ai.dynamic_spawner import DynamicSpawner
-from ..data.scenarios import ScenarioGenerator
+from ..ai.search import manhattan_distance
+from ..data.scenarios import ScenarioGenerator, generate_cached_scenario
 from ..utils.logger import get_logger, reset_logger
 from ..utils.config import SIMULATION, GRID, UI, ActionType
 from ..ui.renderer import Renderer
 
 
+# coordination_mode argument -> forced CoordinationMode (None = hybrid auto-select)
+_MODE_MAP = {
+    'centralized': CoordinationMode.CENTRALIZED,
+    'auction': CoordinationMode.AUCTION,
+    'coalition': CoordinationMode.COALITION,
+    'hybrid': None
+}
+
+# Event types run() reacts to (Renderer.handle_event only handles KEYDOWN)
+_HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN)
+
+
 class Simulator:
     """
     Main simulation orchestrator.
@@ -46,7 +59,7 @@ class Simulator:
     - Handle UI and user input
     """
     
-    def __init__(self, seed: Optional[int] = None, coordination_mode: Optional[str] = None, enable_spawning: bool = True, verbose: bool = True, difficulty: Optional[str] = None):
+    def __init__(self, seed: Optional[int] = None, coordination_mode: Optional[str] = None, enable_spawning: bool = True, verbose: bool = True, difficulty: Optional[str] = None, headless: bool = False):
         """
         Initialize simulator.
         
@@ -56,6 +69,7 @@ class Simulator:
             enable_spawning: Enable dynamic agent spawning
             verbose: Enable explainability and detailed logging
             difficulty: Scenario difficulty ('easy', 'medium', 'hard', 'extreme', 'nightmare')
+            headless: Skip the renderer (no pygame window); use run_headless()
         """
         self.seed = seed or SIMULATION.RANDOM_SEED
         self.timestep = 0
@@ -64,18 +78,10 @@ class Simulator:
         self.enable_spawning = enable_spawning
         self.verbose = verbose  # Enable explainability by default
         self.difficulty = difficulty  # Scenario difficulty
+        self.headless = headless  # No renderer / pygame display
         
         # Parse coordination mode
-        if coordination_mode:
-            mode_map = {
-                'centralized': CoordinationMode.CENTRALIZED,
-                'auction': CoordinationMode.AUCTION,
-                'coalition': CoordinationMode.COALITION,
-                'hybrid': None
-            }
-            self.force_mode = mode_map.get(coordination_mode.lower(), None)
-        else:
-            self.force_mode = None
+        self.force_mode = _MODE_MAP.get(coordination_mode.lower()) if coordination_mode else None
         
         # Initialize logger
         reset_logger()
@@ -94,6 +100,9 @@ class Simulator:
         # Track allocation for reallocation
         self.current_allocation = {}
         
+        # Coordinator view of the agents, refreshed in place every timestep
+        self._agent_info: Dict[str, Dict] = {}
+        
         # Metrics
         self.total_survivors_rescued = 0
         self.total_cells_explored = 0
@@ -107,48 +116,14 @@ class Simulator:
         self.logger._write("INITIALIZING SIMULATION", "MINIMAL")
         self.logger._write("="*80, "MINIMAL")
         
-        # Generate scenario based on difficulty
-        scenario_gen = ScenarioGenerator(self.seed)
+        self._build_world()
         
-        if self.difficulty:
-            scenario = scenario_gen.generate_scenario_by_difficulty(self.difficulty)
-            self.logger.log_metric("Scenario", f"Difficulty={self.difficulty.upper()}")
-        else:
-            scenario = scenario_gen.generate_standard_scenario()
-            self.logger.log_metric("Scenario", "Standard")
-        
-        # Initialize grid
-        self.grid = Grid(
-            width=scenario['width'],
-            height=scenario['height'],
-            seed=self.seed
-        )
-        scenario_gen.apply_scenario_to_grid(self.grid, scenario)
-        
-        # Store initial survivor count
-        self.initial_survivors = len(scenario['survivors'])
-        
-        self.logger.log_metric("Grid size", f"{self.grid.width}x{self.grid.height}")
-        self.logger.log_metric("Initial survivors", self.initial_survivors)
-        self.logger.log_metric("Safe zones", len(scenario['safe_zones']))
-        
-        # Initialize risk model
-        self.risk_model = BayesianRiskModel()
-        self.risk_model.initialize_grid(self.grid.width, self.grid.height)
-        
-        # Initialize agents - more rescue agents for better success rate
-        agent_positions = scenario['agent_positions']
-        
-        self.agents = [
-            ExplorerAgent("EXP-1", agent_positions['explorer']),
-            ExplorerAgent("EXP-2", agent_positions['explorer']),  # 2nd explorer
-            RescueAgent("RES-1", agent_positions['rescue']),
-            RescueAgent("RES-2", agent_positions['rescue']),      # 2nd rescue
-            RescueAgent("RES-3", agent_positions['rescue']),      # 3rd rescue
-            SupportAgent("SUP-1", agent_positions['support']),
-        ]
+        self._agent_info = {}
+        self.current_allocation = {}
         
-        self.logger.log_metric("Agents initialized", len(self.agents))
+        # Running totals, advanced by per-agent deltas during timesteps
+        self.total_survivors_rescued = 0
+        self.total_cells_explored = 0
         
         # Initialize CSP allocator
         self.csp_allocator = CSPAllocator()
@@ -182,11 +157,65 @@ class Simulator:
         else:
             self.logger.log_metric("Coordinator mode", "HYBRID (auto-select)")
         
-        # Initialize renderer
-        self.renderer = Renderer(UI.WINDOW_WIDTH, UI.WINDOW_HEIGHT)
+        # Initialize renderer (opens the pygame window, skipped when headless;
+        # a reset keeps the existing window)
+        if not self.headless and self.renderer is None:
+            self.renderer = Renderer(UI.WINDOW_WIDTH, UI.WINDOW_HEIGHT)
         
         self.logger._write("Initialization complete\n", "MINIMAL")
     
+    def _build_world(self):
+        """
+        Generate the scenario: grid, risk model and initial agents.
+        
+        Difficulty scenarios come from generate_cached_scenario, so a reset
+        rebuilds the t=0 world from the memoized scenario where one exists.
+        Grid reseeds the global random state, so the rebuilt world replays
+        exactly what a fresh simulator would.
+        """
+        # Generate scenario based on difficulty
+        scenario_gen = ScenarioGenerator(self.seed)
+        
+        if self.difficulty:
+            scenario = generate_cached_scenario(self.seed, self.difficulty)
+            self.logger.log_metric("Scenario", f"Difficulty={self.difficulty.upper()}")
+        else:
+            scenario = scenario_gen.generate_standard_scenario()
+            self.logger.log_metric("Scenario", "Standard")
+        
+        # Initialize grid
+        self.grid = Grid(
+            width=scenario.width,
+            height=scenario.height,
+            seed=self.seed
+        )
+        scenario_gen.apply_scenario_to_grid(self.grid, scenario)
+        
+        # Store initial survivor count
+        self.initial_survivors = len(scenario.survivors)
+        
+        self.logger.log_metric("Grid size", f"{self.grid.width}x{self.grid.height}")
+        self.logger.log_metric("Initial survivors", self.initial_survivors)
+        self.logger.log_metric("Safe zones", len(scenario.safe_zones))
+        
+        # Initialize risk model
+        self.risk_model = BayesianRiskModel()
+        self.risk_model.initialize_grid(self.grid.width, self.grid.height)
+        
+        # Initialize agents - more rescue agents for better success rate
+        agent_positions = scenario.agent_positions
+        
+        self.agents = [
+            ExplorerAgent("EXP-1", agent_positions['explorer']),
+            ExplorerAgent("EXP-2", agent_positions['explorer']),  # 2nd explorer
+            RescueAgent("RES-1", agent_positions['rescue']),
+            RescueAgent("RES-2", agent_positions['rescue']),      # 2nd rescue
+            RescueAgent("RES-3", agent_positions['rescue']),      # 3rd rescue
+            SupportAgent("SUP-1", agent_positions['support']),
+        ]
+        
+        self.logger.log_metric("Agents initialized", len(self.agents))
+    
     def run(self):
         """
         Main simulation loop.
@@ -195,48 +224,91 @@ class Simulator:
         """
         clock = pygame.time.Clock()
         
-        while self.running and self.timestep < SIMULATION.MAX_TIMESTEPS:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    command = self.renderer.handle_event(event)
-                    if command == "QUIT":
-                        self.running = False
-                    elif command == "PAUSE":
-                        self.paused = not self.paused
-                    elif command == "RESET":
-                        self.reset()
+        # Keep unhandled events (mouse motion, window events) out of the
+        # queue, so most frames find it empty and skip event.get() entirely
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+        
+        try:
+            while self.running and self.timestep < SIMULATION.MAX_TIMESTEPS:
+                # Handle events (peek() pumps the queue and just answers yes/no)
+                if pygame.event.peek(_HANDLED_EVENTS):
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            self.running = False
+                        else:
+                            command = self.renderer.handle_event(event)
+                            if command == "QUIT":
+                                self.running = False
+                            elif command == "PAUSE":
+                                self.paused = not self.paused
+                            elif command == "RESET":
+                                self.reset()
             
-            # Execute timestep if not paused
-            if not self.paused:
-                self.execute_timestep()
+                # Execute timestep if not paused
+                if not self.paused:
+                    self.execute_timestep()
             
-            # Render
-            self.renderer.render(self.grid, self.agents, self.risk_model, self.timestep, self.coordinator, self.initial_survivors)
+                # Render
+                self.renderer.render(self.grid, self.agents, self.risk_model, self.timestep, self.coordinator, self.initial_survivors)
             
-            # Check win condition
-            if len(self.grid.survivor_positions) == 0:
-                self.logger._write("\n" + "="*80, "MINIMAL")
-                self.logger._write("ALL SURVIVORS RESCUED!", "MINIMAL")
-                self.logger._write(f"Completed in {self.timestep} timesteps", "MINIMAL")
-                self.logger._write("="*80, "MINIMAL")
+                # Check win condition
+                if len(self.grid.survivor_positions) == 0:
+                    self.logger._write("\n" + "="*80, "MINIMAL")
+                    self.logger._write("ALL SURVIVORS RESCUED!", "MINIMAL")
+                    self.logger._write(f"Completed in {self.timestep} timesteps", "MINIMAL")
+                    self.logger._write("="*80, "MINIMAL")
                 
-                # Render final state one more time
-                self.renderer.render(self.grid, self.agents, self.risk_model, self.timestep, self.coordinator, self.initial_survivors)
-                pygame.display.flip()
+                    # Render final state one more time
+                    self.renderer.render(self.grid, self.agents, self.risk_model, self.timestep, self.coordinator, self.initial_survivors)
+                    pygame.display.flip()
                 
-                # Wait 3 seconds to show completion message, then exit
-                pygame.time.wait(3000)
-                self.running = False
+                    # Wait 3 seconds to show completion message, then exit
+                    pygame.time.wait(3000)
+                    self.running = False
             
-            # Control frame rate
-            clock.tick(SIMULATION.TARGET_FPS)
+                # Control frame rate
+                clock.tick(SIMULATION.TARGET_FPS)
+        
+        finally:
+            # The event filter is process-global; restore it even if a
+            # timestep or render raises
+            pygame.event.set_allowed(None)
         
         # Finalize
         self.finalize()
     
+    def run_headless(self, max_timesteps: Optional[int] = None, finalize_run: bool = True) -> int:
+        """
+        Simulation loop without rendering or event handling.
+        
+        Args:
+            max_timesteps: Timestep limit (defaults to SIMULATION.MAX_TIMESTEPS)
+            finalize_run: Call finalize() afterwards (writes the summary log
+                          and explanation_audit.json)
+            
+        Returns:
+            Number of timesteps executed
+            
+        Initializes the simulation first if that has not been done, then runs
+        timesteps back to back until every survivor is rescued or the limit
+        is reached. No pygame calls are made, so this pairs with
+        headless=True for benchmarks and batch runs.
+        """
+        if self.grid is None:
+            self.initialize()
+        
+        limit = max_timesteps if max_timesteps is not None else SIMULATION.MAX_TIMESTEPS
+        start = self.timestep
+        
+        while self.running and self.timestep < limit and self.grid.survivor_count:
+            self.execute_timestep()
+        
+        if finalize_run:
+            self.finalize()
+        
+        return self.timestep - start
+    
     def execute_timestep(self):
         """
         Execute one simulation timestep.
@@ -253,8 +325,9 @@ class Simulator:
         # Update communication network timestep
         self.comm_network.advance_timestep()
         
-        # Get current survivor positions (needed for spawning and coordination)
-        survivors = list(self.grid.survivor_positions)
+        # Get current survivor positions (needed for spawning and coordination);
+        # the grid reuses the same snapshot until a survivor is added or removed
+        survivors = self.grid.get_survivors()
         
         # Dynamic agent spawning (if enabled)
         if self.spawner:
@@ -280,10 +353,17 @@ class Simulator:
                     )
         
         # 2. Update risk probabilities for all agents
+        log_perception = self.verbose and self.logger.enabled_for("VERBOSE")
         for agent in self.agents:
+            explored_before = agent.explored_count
             observations = agent.perceive(self.grid, self.risk_model)
+            self.total_cells_explored += agent.explored_count - explored_before
             agent.update_beliefs(observations, self.grid, self.risk_model)
             
+            # Per-agent trace is only kept for verbose runs
+            if not log_perception:
+                continue
+            
             self.logger.log_agent_perception(
                 agent.agent_id,
                 agent.position,
@@ -298,16 +378,7 @@ class Simulator:
             )
         
         # 3. Assign tasks via HYBRID COORDINATOR
-        agent_info = {
-            agent.agent_id: {
-                'position': agent.position,
-                'type': agent.agent_type,
-                'current_load': len(agent.assigned_tasks),
-                'carrying': agent.carrying_survivor,
-                'explored_cells': agent.explored_cells
-            }
-            for agent in self.agents
-        }
+        agent_info = self._refresh_agent_info()
         
         if survivors:
             # Assess environment for protocol selection (now with confidence intervals)
@@ -328,20 +399,24 @@ class Simulator:
             
             # Log explanation if available (NEW v2.1 - ENABLED)
             if self.coordinator.last_explanation:
-                explanation_text = self.coordinator.last_explanation.to_natural_language()
-                self.logger._write(f"\n--- COORDINATION DECISION ---\n{explanation_text}\n", "NORMAL")
+                if self.logger.enabled_for("NORMAL"):
+                    explanation_text = self.coordinator.last_explanation.to_natural_language()
+                    self.logger._write(f"\n--- COORDINATION DECISION ---\n{explanation_text}\n", "NORMAL")
                 
                 # Store for GUI display
                 if self.renderer:
                     self.renderer.last_explanation = self.coordinator.last_explanation
             
-            # Allocate tasks using selected protocol
+            # Allocate tasks using selected protocol. The distance function
+            # must keep its identity across timesteps: the CSP allocator
+            # keeps agent -> survivor distance rows between calls and only
+            # recomputes rows for agents that moved.
             allocation = self.coordinator.allocate_tasks(
                 selected_mode,
                 agent_info,
                 survivors,
                 self.risk_model,
-                lambda p1, p2: abs(p1[0] - p2[0]) + abs(p1[1] - p2[1]),
+                manhattan_distance,
                 current_allocation=self.current_allocation
             )
             
@@ -350,7 +425,7 @@ class Simulator:
             
             # Log coordination details
             self.logger.log_task_allocation(allocation)
-            if self.timestep % 10 == 0:  # Log mode every 10 timesteps
+            if self.timestep % 10 == 0 and self.logger.enabled_for("NORMAL"):  # Log mode every 10 timesteps
                 self.logger.log_metric(
                     f"T{self.timestep} Coord Mode",
                     f"{selected_mode.value} (risk={assessment.avg_risk:.2f}, uncertainty={assessment.uncertainty_level()})"
@@ -385,7 +460,9 @@ class Simulator:
                     result = "Hazard suppression active"
                 else:
                     # Execute normal action
+                    rescued_before = agent.survivors_rescued
                     success, result = agent.execute_action(action, self.grid)
+                    self.total_survivors_rescued += agent.survivors_rescued - rescued_before
                     
                     self.logger.log_action(
                         agent.agent_id,
@@ -393,26 +470,52 @@ class Simulator:
                         agent.position,
                         result
                     )
-                
-                # Update metrics
-                if agent.agent_type == "RESCUE":
-                    self.total_survivors_rescued = sum(
-                        a.survivors_rescued for a in self.agents
-                    )
-                
-                self.total_cells_explored = sum(
-                    len(a.explored_cells) for a in self.agents
-                )
         
         # Increment timestep
         self.timestep += 1
     
+    def _refresh_agent_info(self) -> Dict[str, Dict]:
+        """
+        Bring the coordinator's agent view up to date.
+        
+        Returns:
+            Mapping agent_id -> {position, type, current_load, carrying,
+            explored_cells}
+            
+        Rationale:
+            The per-agent dicts live for the whole run and are updated in
+            place, so a timestep allocates nothing here. Entries for agents
+            added by the spawner are created on first sight; explored_cells
+            is shared with the agent rather than copied.
+        """
+        agent_info = self._agent_info
+        for agent in self.agents:
+            info = agent_info.get(agent.agent_id)
+            if info is None:
+                agent_info[agent.agent_id] = {
+                    'position': agent.position,
+                    'type': agent.agent_type,
+                    'current_load': len(agent.assigned_tasks),
+                    'carrying': agent.carrying_survivor,
+                    'explored_cells': agent.explored_cells
+                }
+                continue
+            info['position'] = agent.position
+            info['current_load'] = len(agent.assigned_tasks)
+            info['carrying'] = agent.carrying_survivor
+        return agent_info
+    
     def _execute_timestep(self):
-        """Alias for execute_timestep (used by benchmark suite for headless mode)."""
+        """Alias for execute_timestep (kept for callers driving their own loop)."""
         self.execute_timestep()
     
     def reset(self):
-        """Reset simulation to initial state."""
+        """
+        Reset simulation to initial state.
+        
+        initialize() rebuilds the t=0 world from the (memoized) scenario
+        and keeps the open window.
+        """
         self.logger._write("\n=== SIMULATION RESET ===\n", "MINIMAL")
         self.timestep = 0
         self.paused = False
@@ -458,7 +561,8 @@ class Simulator:
             self.logger._write(f"  Blocked steps: {state['blocked_steps']}", "MINIMAL")
         
         # Cleanup
-        self.renderer.cleanup()
+        if self.renderer:
+            self.renderer.cleanup()
         
         # NEW v2.1: Generate explainability report
         if self.coordinator and self.coordinator.explanation_engine:
@@ -5,10 +5,137 @@ Ensures deterministic generation via random seeds.
 """
 
 import random
-from typing import List, Tuple, Optional
+from dataclasses import asdict, dataclass, replace
+from functools import lru_cache
+from itertools import combinations
+from typing import AbstractSet, Dict, FrozenSet, List, Tuple, Optional
 from ..core.environment import Grid
+from ..utils.compat import DATACLASS_SLOTS
 from ..utils.config import SIMULATION, GRID
 
+# Difficulty levels built by _generate_custom_scenario, with fixed parameters
+_CUSTOM_PRESETS = {
+    # Small grid, few survivors, low hazards
+    'easy': {'grid_size': (20, 20), 'num_survivors': 5, 'hazard_density': 0.10},
+    # Maximum difficulty
+    'nightmare': {'grid_size': (80, 80), 'num_survivors': 40, 'hazard_density': 0.45},
+}
+
+# Difficulty levels with a dedicated generator method
+_DIFFICULTY_METHODS = {
+    'medium': 'generate_standard_scenario',
+    'hard': 'generate_high_risk_scenario',
+    'extreme': 'generate_extreme_scenario',
+}
+
+# Levels whose scenario depends only on the seed. 'medium' (and the fallback
+# for unknown levels) reads GRID and SIMULATION at generation time, which
+# main_advanced.py overrides at runtime, so it is never memoized.
+_CACHEABLE_DIFFICULTIES = frozenset(_CUSTOM_PRESETS) | {'hard', 'extreme'}
+
+
+Position = Tuple[int, int]
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Scenario:
+    """
+    Generated disaster scenario.
+    
+    Attributes:
+        width, height: Grid dimensions
+        safe_zones, survivors, fires, floods, debris: Initial positions
+        agent_positions: Starting position per agent type
+        seed: Seed the scenario was generated from
+        difficulty: Generator that produced it ('standard', 'high', ...)
+        hazard_density: Target hazard coverage (None for standard scenarios)
+    """
+    width: int
+    height: int
+    safe_zones: Tuple[Position, ...]
+    survivors: Tuple[Position, ...]
+    fires: Tuple[Position, ...]
+    floods: Tuple[Position, ...]
+    debris: Tuple[Position, ...]
+    agent_positions: Dict[str, Position]
+    seed: int
+    difficulty: str = 'standard'
+    hazard_density: Optional[float] = None
+    
+    def as_dict(self) -> dict:
+        """Plain-dict form, e.g. for JSON export."""
+        return asdict(self)
+
+
+def _corner_zones(width: int, height: int) -> List[Tuple[int, int]]:
+    """Candidate safe zones of the standard scenario, one per corner."""
+    margin = 3
+    return [
+        (margin, margin),  # Top-left
+        (width - margin - 1, margin),  # Top-right
+        (margin, height - margin - 1),  # Bottom-left
+        (width - margin - 1, height - margin - 1),  # Bottom-right
+    ]
+
+
+def _near_safe_zones(safe_zones: List[Tuple[int, int]]) -> AbstractSet[Tuple[int, int]]:
+    """Every cell within Manhattan distance 5 of some safe zone."""
+    return {
+        (sx + dx, sy + dy)
+        for sx, sy in safe_zones
+        for dx in range(-5, 6)
+        for dy in range(abs(dx) - 5, 6 - abs(dx))
+    }
+
+
+def check_standard_scenario(width: int, height: int, num_survivors: int,
+                            num_fires: int, num_floods: int,
+                            num_debris: int) -> Optional[str]:
+    """
+    Check that a standard scenario with these settings can be generated.
+    
+    Args:
+        width, height: Grid dimensions
+        num_survivors: Survivors to place
+        num_fires, num_floods, num_debris: Initial hazard counts
+        
+    Returns:
+        None if it fits, otherwise a message for the user
+    
+    Mirrors generate_standard_scenario's placement rules and takes the
+    worst case over which corners become safe zones, so settings that
+    pass never make _sample_free raise for any seed.
+    """
+    interior = max(0, width - 2) * max(0, height - 2)
+    
+    survivor_room = None
+    hazard_room = None
+    corners = _corner_zones(width, height)
+    for zones in combinations(corners, min(SIMULATION.NUM_SAFE_ZONES, len(corners))):
+        near = _near_safe_zones(zones)
+        free = sum(
+            1
+            for x in range(5, width - 5)
+            for y in range(5, height - 5)
+            if (x, y) not in near
+        )
+        inside = sum(1 for x, y in set(zones) if 1 <= x <= width - 2 and 1 <= y <= height - 2)
+        survivor_room = free if survivor_room is None else min(survivor_room, free)
+        hazard_room = interior - inside if hazard_room is None else min(hazard_room, interior - inside)
+    
+    if survivor_room == 0:
+        return f"A {width}x{height} grid is too small for survivors"
+    if num_survivors > survivor_room:
+        return f"A {width}x{height} grid fits at most {survivor_room} survivors"
+    
+    # Floods avoid fires as well; debris may share cells with either
+    hazards = max(num_fires + num_floods, num_debris)
+    if hazards + num_survivors > hazard_room:
+        return (f"A {width}x{height} grid fits {hazard_room - num_survivors} hazard "
+                f"cells, not {hazards}: lower the coverage")
+    
+    return None
+
 
 class ScenarioGenerator:
     """
@@ -21,6 +148,9 @@ class ScenarioGenerator:
     - Agent starting positions
     
     Design: Deterministic generation for reproducible experiments
+    
+    Generators return frozen Scenario records whose position collections
+    are tuples: they are only read.
     """
     
     def __init__(self, seed: Optional[int] = None):
@@ -31,14 +161,16 @@ class ScenarioGenerator:
             seed: Random seed for deterministic generation
         """
         self.seed = seed or SIMULATION.RANDOM_SEED
-        random.seed(self.seed)
+        # Private generator: scenario draws neither read nor disturb the
+        # global random state used by the grid and agents
+        self._rng = random.Random(self.seed)
     
-    def generate_standard_scenario(self) -> dict:
+    def generate_standard_scenario(self) -> Scenario:
         """
         Generate standard disaster scenario.
         
         Returns:
-            Dictionary with scenario configuration
+            Scenario configuration
         """
         width = GRID.WIDTH
         height = GRID.HEIGHT
@@ -48,29 +180,30 @@ class ScenarioGenerator:
         
         # Place safe zones at corners
         safe_zones = self._generate_safe_zones(width, height)
+        safe_set = frozenset(safe_zones)  # shared by the hazard exclusion checks
         
         # Place survivors in middle regions
         survivors = self._generate_survivors(width, height, safe_zones)
         
         # Place initial hazards
-        fires = self._generate_fires(width, height, safe_zones, survivors)
-        floods = self._generate_floods(width, height, safe_zones, survivors, fires)
-        debris = self._generate_debris(width, height, safe_zones, survivors)
+        fires = self._generate_fires(width, height, safe_set, survivors)
+        floods = self._generate_floods(width, height, safe_set, survivors, fires)
+        debris = self._generate_debris(width, height, safe_set, survivors)
         
         # Agent starting positions (near safe zones)
         agent_positions = self._generate_agent_positions(width, height, safe_zones)
         
-        return {
-            'width': width,
-            'height': height,
-            'safe_zones': safe_zones,
-            'survivors': survivors,
-            'fires': fires,
-            'floods': floods,
-            'debris': debris,
-            'agent_positions': agent_positions,
-            'seed': self.seed
-        }
+        return Scenario(
+            width=width,
+            height=height,
+            safe_zones=tuple(safe_zones),
+            survivors=tuple(survivors),
+            fires=tuple(fires),
+            floods=tuple(floods),
+            debris=tuple(debris),
+            agent_positions=agent_positions,
+            seed=self.seed
+        )
     
     def _generate_safe_zones(self, width: int, height: int) -> List[Tuple[int, int]]:
         """
@@ -85,20 +218,11 @@ class ScenarioGenerator:
             
         Strategy: Place at grid edges for maximum separation
         """
-        safe_zones = []
-        margin = 3
-        
-        # Place in corners or edges
-        positions = [
-            (margin, margin),  # Top-left
-            (width - margin - 1, margin),  # Top-right
-            (margin, height - margin - 1),  # Bottom-left
-            (width - margin - 1, height - margin - 1),  # Bottom-right
-        ]
+        positions = _corner_zones(width, height)
         
         # Select subset
         num_zones = min(SIMULATION.NUM_SAFE_ZONES, len(positions))
-        safe_zones = random.sample(positions, num_zones)
+        safe_zones = self._rng.sample(positions, num_zones)
         
         return safe_zones
     
@@ -113,94 +237,75 @@ class ScenarioGenerator:
             
         Returns:
             List of survivor positions
-        """
-        survivors = []
-        attempts = 0
-        max_attempts = 1000
-        
-        while len(survivors) < SIMULATION.NUM_SURVIVORS and attempts < max_attempts:
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            
-            # Don't place on safe zones or existing survivors
-            if pos not in safe_zones and pos not in survivors:
-                # Check not too close to safe zones
-                min_dist_to_safe = min(
-                    abs(x - sx) + abs(y - sy) for sx, sy in safe_zones
-                )
-                
-                if min_dist_to_safe > 5:
-                    survivors.append(pos)
             
-            attempts += 1
-        
-        return survivors
+        Strategy: Sample without replacement from the cells far enough
+        (> 5) from all safe zones
+        """
+        return self._sample_free(SIMULATION.NUM_SURVIVORS,
+                                 5, width - 6, 5, height - 6,
+                                 _near_safe_zones(safe_zones))
     
     def _generate_fires(self, width: int, height: int,
-                       safe_zones: List[Tuple[int, int]],
+                       safe_set: FrozenSet[Tuple[int, int]],
                        survivors: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """Generate initial fire positions."""
-        fires = []
-        attempts = 0
-        max_attempts = 1000
-        
-        while len(fires) < SIMULATION.NUM_INITIAL_FIRES and attempts < max_attempts:
-            x = random.randint(1, width - 2)
-            y = random.randint(1, height - 2)
-            pos = (x, y)
-            
-            # Don't place on safe zones or survivors
-            if pos not in safe_zones and pos not in survivors:
-                fires.append(pos)
-            
-            attempts += 1
-        
-        return fires
+        # Don't place on safe zones or survivors
+        blocked = safe_set.union(survivors)
+        return self._sample_free(SIMULATION.NUM_INITIAL_FIRES,
+                                 1, width - 2, 1, height - 2, blocked)
     
     def _generate_floods(self, width: int, height: int,
-                        safe_zones: List[Tuple[int, int]],
+                        safe_set: FrozenSet[Tuple[int, int]],
                         survivors: List[Tuple[int, int]],
                         fires: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """Generate initial flood positions."""
-        floods = []
-        attempts = 0
-        max_attempts = 1000
-        
-        while len(floods) < SIMULATION.NUM_INITIAL_FLOODS and attempts < max_attempts:
-            x = random.randint(1, width - 2)
-            y = random.randint(1, height - 2)
-            pos = (x, y)
-            
-            # Don't place on safe zones, survivors, or fires
-            if (pos not in safe_zones and pos not in survivors and 
-                pos not in fires):
-                floods.append(pos)
-            
-            attempts += 1
-        
-        return floods
+        # Don't place on safe zones, survivors, or fires
+        blocked = safe_set.union(survivors, fires)
+        return self._sample_free(SIMULATION.NUM_INITIAL_FLOODS,
+                                 1, width - 2, 1, height - 2, blocked)
     
     def _generate_debris(self, width: int, height: int,
-                        safe_zones: List[Tuple[int, int]],
+                        safe_set: FrozenSet[Tuple[int, int]],
                         survivors: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
         """Generate initial debris positions."""
-        debris = []
-        attempts = 0
-        max_attempts = 1000
-        
-        while len(debris) < SIMULATION.NUM_INITIAL_DEBRIS and attempts < max_attempts:
-            x = random.randint(1, width - 2)
-            y = random.randint(1, height - 2)
-            pos = (x, y)
+        # Don't place on safe zones or survivors
+        blocked = safe_set.union(survivors)
+        return self._sample_free(SIMULATION.NUM_INITIAL_DEBRIS,
+                                 1, width - 2, 1, height - 2, blocked)
+    
+    def _sample_free(self, count: int, x_lo: int, x_hi: int,
+                     y_lo: int, y_hi: int,
+                     occupied: AbstractSet[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Draw distinct free positions inside an inclusive bounding box.
+        
+        Args:
+            count: Number of positions wanted
+            x_lo, x_hi, y_lo, y_hi: Inclusive coordinate bounds
+            occupied: Cells that must not be used
             
-            # Don't place on safe zones or survivors
-            if pos not in safe_zones and pos not in survivors:
-                debris.append(pos)
+        Returns:
+            count positions
             
-            attempts += 1
+        Raises:
+            ValueError: If the box has fewer than count free cells
         
-        return debris
+        Strategy: Enumerate the free cells once and sample without
+        replacement - no rejected draws, even at high hazard densities,
+        and never silently fewer positions than requested
+        """
+        free = [
+            (x, y)
+            for x in range(x_lo, x_hi + 1)
+            for y in range(y_lo, y_hi + 1)
+            if (x, y) not in occupied
+        ]
+        if len(free) < count:
+            raise ValueError(
+                f"Cannot place {count} positions: only {len(free)} free cells "
+                f"in x={x_lo}..{x_hi}, y={y_lo}..{y_hi}"
+            )
+        return self._rng.sample(free, count)
     
     def _generate_agent_positions(self, width: int, height: int,
                                  safe_zones: List[Tuple[int, int]]) -> dict:
@@ -236,35 +341,21 @@ class ScenarioGenerator:
         
         return positions
     
-    def apply_scenario_to_grid(self, grid: Grid, scenario: dict):
+    def apply_scenario_to_grid(self, grid: Grid, scenario: Scenario):
         """
         Apply scenario configuration to grid.
         
         Args:
             grid: Grid instance to configure
-            scenario: Scenario dictionary from generate_*
+            scenario: Scenario from generate_*
         """
-        # Add safe zones
-        for x, y in scenario['safe_zones']:
-            grid.add_safe_zone(x, y)
-        
-        # Add survivors
-        for x, y in scenario['survivors']:
-            grid.add_survivor(x, y)
-        
-        # Add fires
-        for x, y in scenario['fires']:
-            grid.add_fire(x, y)
-        
-        # Add floods
-        for x, y in scenario['floods']:
-            grid.add_flood(x, y)
-        
-        # Add debris
-        for x, y in scenario['debris']:
-            grid.add_debris(x, y)
+        grid.add_safe_zones(scenario.safe_zones)
+        grid.add_survivors(scenario.survivors)
+        grid.add_fires(scenario.fires)
+        grid.add_floods(scenario.floods)
+        grid.add_debris_cells(scenario.debris)
 
-    def generate_high_risk_scenario(self, grid_size: Tuple[int, int] = (40, 40)) -> dict:
+    def generate_high_risk_scenario(self, grid_size: Tuple[int, int] = (40, 40)) -> Scenario:
         """
         Generate HIGH-RISK scenario to force mode switching.
         
@@ -278,7 +369,7 @@ class ScenarioGenerator:
             grid_size: Grid dimensions (width, height)
             
         Returns:
-            High-risk scenario dictionary
+            High-risk scenario
         """
         width, height = grid_size
         total_cells = width * height
@@ -299,40 +390,23 @@ class ScenarioGenerator:
         ]
         
         # Survivors - distributed across grid
-        survivors = []
-        for i in range(15):
-            x = random.randint(8, width - 9)
-            y = random.randint(8, height - 9)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                survivors.append(pos)
+        occupied = set(safe_zones)
+        survivors = self._sample_free(15, 8, width - 9, 8, height - 9,
+                                      occupied)
+        occupied.update(survivors)
         
         # Fires - clustered for high risk
-        fires = []
-        for i in range(num_fires):
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                fires.append(pos)
+        fires = self._sample_free(num_fires, 5, width - 6, 5, height - 6,
+                                  occupied)
         
         # Floods
-        floods = []
-        for i in range(num_floods):
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors and pos not in fires:
-                floods.append(pos)
+        flood_blocked = occupied.union(fires)
+        floods = self._sample_free(num_floods, 5, width - 6, 5, height - 6,
+                                   flood_blocked)
         
         # Debris
-        debris = []
-        for i in range(num_debris):
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                debris.append(pos)
+        debris = self._sample_free(num_debris, 5, width - 6, 5, height - 6,
+                                   occupied)
         
         # Agent positions
         agent_positions = {
@@ -341,21 +415,21 @@ class ScenarioGenerator:
             'support': (4, 4)
         }
         
-        return {
-            'width': width,
-            'height': height,
-            'safe_zones': safe_zones,
-            'survivors': survivors,
-            'fires': fires,
-            'floods': floods,
-            'debris': debris,
-            'agent_positions': agent_positions,
-            'seed': self.seed,
-            'difficulty': 'high',
-            'hazard_density': hazard_density
-        }
+        return Scenario(
+            width=width,
+            height=height,
+            safe_zones=tuple(safe_zones),
+            survivors=tuple(survivors),
+            fires=tuple(fires),
+            floods=tuple(floods),
+            debris=tuple(debris),
+            agent_positions=agent_positions,
+            seed=self.seed,
+            difficulty='high',
+            hazard_density=hazard_density
+        )
     
-    def generate_extreme_scenario(self, grid_size: Tuple[int, int] = (60, 60)) -> dict:
+    def generate_extreme_scenario(self, grid_size: Tuple[int, int] = (60, 60)) -> Scenario:
         """
         Generate EXTREME scenario for stress testing.
         
@@ -369,7 +443,7 @@ class ScenarioGenerator:
             grid_size: Grid dimensions
             
         Returns:
-            Extreme scenario dictionary
+            Extreme scenario
         """
         width, height = grid_size
         total_cells = width * height
@@ -391,38 +465,21 @@ class ScenarioGenerator:
         ]
         
         # Survivors
-        survivors = []
-        for i in range(25):
-            x = random.randint(10, width - 11)
-            y = random.randint(10, height - 11)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                survivors.append(pos)
+        occupied = set(safe_zones)
+        survivors = self._sample_free(25, 10, width - 11, 10, height - 11,
+                                      occupied)
+        occupied.update(survivors)
         
         # Hazards - dense placement
-        fires = []
-        for i in range(num_fires):
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                fires.append(pos)
-        
-        floods = []
-        for i in range(num_floods):
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors and pos not in fires:
-                floods.append(pos)
-        
-        debris = []
-        for i in range(num_debris):
-            x = random.randint(5, width - 6)
-            y = random.randint(5, height - 6)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                debris.append(pos)
+        fires = self._sample_free(num_fires, 5, width - 6, 5, height - 6,
+                                  occupied)
+        
+        flood_blocked = occupied.union(fires)
+        floods = self._sample_free(num_floods, 5, width - 6, 5, height - 6,
+                                   flood_blocked)
+        
+        debris = self._sample_free(num_debris, 5, width - 6, 5, height - 6,
+                                   occupied)
         
         agent_positions = {
             'explorer': (5, 3),
@@ -430,21 +487,21 @@ class ScenarioGenerator:
             'support': (4, 4)
         }
         
-        return {
-            'width': width,
-            'height': height,
-            'safe_zones': safe_zones,
-            'survivors': survivors,
-            'fires': fires,
-            'floods': floods,
-            'debris': debris,
-            'agent_positions': agent_positions,
-            'seed': self.seed,
-            'difficulty': 'extreme',
-            'hazard_density': hazard_density
-        }
+        return Scenario(
+            width=width,
+            height=height,
+            safe_zones=tuple(safe_zones),
+            survivors=tuple(survivors),
+            fires=tuple(fires),
+            floods=tuple(floods),
+            debris=tuple(debris),
+            agent_positions=agent_positions,
+            seed=self.seed,
+            difficulty='extreme',
+            hazard_density=hazard_density
+        )
     
-    def generate_scenario_by_difficulty(self, difficulty: str = 'medium') -> dict:
+    def generate_scenario_by_difficulty(self, difficulty: str = 'medium') -> Scenario:
         """
         Generate scenario based on difficulty level.
         
@@ -452,43 +509,19 @@ class ScenarioGenerator:
             difficulty: One of 'easy', 'medium', 'hard', 'extreme', 'nightmare'
             
         Returns:
-            Scenario dictionary
+            Scenario
         """
-        if difficulty == 'easy':
-            # Small grid, few survivors, low hazards
-            return self._generate_custom_scenario(
-                grid_size=(20, 20),
-                num_survivors=5,
-                hazard_density=0.10
-            )
-        
-        elif difficulty == 'medium':
-            # Standard scenario
-            return self.generate_standard_scenario()
-        
-        elif difficulty == 'hard':
-            # High-risk scenario
-            return self.generate_high_risk_scenario()
+        preset = _CUSTOM_PRESETS.get(difficulty)
+        if preset is not None:
+            return self._generate_custom_scenario(**preset)
         
-        elif difficulty == 'extreme':
-            # Extreme scenario
-            return self.generate_extreme_scenario()
-        
-        elif difficulty == 'nightmare':
-            # Maximum difficulty
-            return self._generate_custom_scenario(
-                grid_size=(80, 80),
-                num_survivors=40,
-                hazard_density=0.45
-            )
-        
-        else:
-            # Default to medium
-            return self.generate_standard_scenario()
+        # Unknown levels default to medium
+        method = _DIFFICULTY_METHODS.get(difficulty, 'generate_standard_scenario')
+        return getattr(self, method)()
     
     def _generate_custom_scenario(self, grid_size: Tuple[int, int],
                                   num_survivors: int,
-                                  hazard_density: float) -> dict:
+                                  hazard_density: float) -> Scenario:
         """
         Generate custom scenario with specific parameters.
         
@@ -498,7 +531,7 @@ class ScenarioGenerator:
             hazard_density: Hazard coverage (0.0-0.5)
             
         Returns:
-            Custom scenario dictionary
+            Custom scenario
         """
         width, height = grid_size
         total_cells = width * height
@@ -518,38 +551,29 @@ class ScenarioGenerator:
         ]
         
         # Survivors
-        survivors = []
-        for i in range(num_survivors):
-            x = random.randint(margin + 2, width - margin - 3)
-            y = random.randint(margin + 2, height - margin - 3)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                survivors.append(pos)
+        occupied = set(safe_zones)
+        survivors = self._sample_free(num_survivors,
+                                      margin + 2, width - margin - 3,
+                                      margin + 2, height - margin - 3,
+                                      occupied)
+        occupied.update(survivors)
         
         # Hazards
-        fires = []
-        for i in range(num_fires):
-            x = random.randint(margin, width - margin - 1)
-            y = random.randint(margin, height - margin - 1)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                fires.append(pos)
-        
-        floods = []
-        for i in range(num_floods):
-            x = random.randint(margin, width - margin - 1)
-            y = random.randint(margin, height - margin - 1)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors and pos not in fires:
-                floods.append(pos)
-        
-        debris = []
-        for i in range(num_debris):
-            x = random.randint(margin, width - margin - 1)
-            y = random.randint(margin, height - margin - 1)
-            pos = (x, y)
-            if pos not in safe_zones and pos not in survivors:
-                debris.append(pos)
+        fires = self._sample_free(num_fires,
+                                  margin, width - margin - 1,
+                                  margin, height - margin - 1,
+                                  occupied)
+        
+        flood_blocked = occupied.union(fires)
+        floods = self._sample_free(num_floods,
+                                   margin, width - margin - 1,
+                                   margin, height - margin - 1,
+                                   flood_blocked)
+        
+        debris = self._sample_free(num_debris,
+                                   margin, width - margin - 1,
+                                   margin, height - margin - 1,
+                                   occupied)
         
         agent_positions = {
             'explorer': (margin + 1, margin),
@@ -557,16 +581,47 @@ class ScenarioGenerator:
             'support': (margin + 1, margin + 1)
         }
         
-        return {
-            'width': width,
-            'height': height,
-            'safe_zones': safe_zones,
-            'survivors': survivors,
-            'fires': fires,
-            'floods': floods,
-            'debris': debris,
-            'agent_positions': agent_positions,
-            'seed': self.seed,
-            'difficulty': 'custom',
-            'hazard_density': hazard_density
-        }
+        return Scenario(
+            width=width,
+            height=height,
+            safe_zones=tuple(safe_zones),
+            survivors=tuple(survivors),
+            fires=tuple(fires),
+            floods=tuple(floods),
+            debris=tuple(debris),
+            agent_positions=agent_positions,
+            seed=self.seed,
+            difficulty='custom',
+            hazard_density=hazard_density
+        )
+
+
+@lru_cache(maxsize=64)
+def _cached_scenario(seed: Optional[int], difficulty: str) -> Scenario:
+    return ScenarioGenerator(seed).generate_scenario_by_difficulty(difficulty)
+
+
+def generate_cached_scenario(seed: Optional[int], difficulty: str) -> Scenario:
+    """
+    Scenario a fresh ScenarioGenerator(seed) produces for difficulty.
+    
+    Args:
+        seed: Random seed (as for ScenarioGenerator)
+        difficulty: Difficulty level (as for generate_scenario_by_difficulty)
+        
+    Returns:
+        Scenario with its own agent_positions dict
+    
+    Fixed-size levels are deterministic in (seed, difficulty), so their
+    results are memoized; evaluation runs replay the same seeds once per
+    protocol. Scenarios are frozen and their positions are tuples, so
+    everything but agent_positions is shared between callers. Levels
+    that read the grid/simulation config are generated afresh each time.
+    """
+    if difficulty not in _CACHEABLE_DIFFICULTIES:
+        return ScenarioGenerator(seed).generate_scenario_by_difficulty(difficulty)
+    
+    # Resolve the default seed here, as ScenarioGenerator would, so a
+    # changed SIMULATION.RANDOM_SEED is not served a stale entry
+    scenario = _cached_scenario(seed or SIMULATION.RANDOM_SEED, difficulty)
+    return replace(scenario, agent_positions=dict(scenario.agent_positions))
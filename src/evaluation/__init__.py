@@ -1,18 +1,26 @@
 """
 Evaluation Module
 Benchmarking, statistical analysis, and performance visualization.
+
+Submodules are imported on first attribute access (PEP 562), so using the
+statistics or analysis helpers does not pull in the simulator and pygame
+through benchmark_suite.
 """
 
-from .benchmark_suite import BenchmarkSuite
-from .statistics import StatisticalAnalyzer
-from .visualizer import BenchmarkVisualizer
-from .analysis import (
-    ScalabilityAnalyzer,
-    SuccessAnalyzer,
-    ModeAnalyzer,
-    AgentAnalyzer,
-    run_comprehensive_analysis
-)
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'BenchmarkSuite': '.benchmark_suite',
+    'StatisticalAnalyzer': '.statistics',
+    'BenchmarkVisualizer': '.visualizer',
+    'ScalabilityAnalyzer': '.analysis',
+    'SuccessAnalyzer': '.analysis',
+    'ModeAnalyzer': '.analysis',
+    'AgentAnalyzer': '.analysis',
+    'run_comprehensive_analysis': '.analysis',
+    'run_fused_analysis': '.analysis',
+}
 
 __all__ = [
     'BenchmarkSuite',
@@ -22,5 +30,18 @@ __all__ = [
     'SuccessAnalyzer',
     'ModeAnalyzer',
     'AgentAnalyzer',
-    'run_comprehensive_analysis'
+    'run_comprehensive_analysis',
+    'run_fused_analysis'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
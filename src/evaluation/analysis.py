@@ -3,8 +3,12 @@ Advanced Analysis Modules
 Scalability, success rate, mode switching, and agent performance analysis.
 """
 
-from typing import Dict, List
-from .statistics import StatisticalAnalyzer
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from ..utils.compat import DATACLASS_SLOTS
 
 
 class ScalabilityAnalyzer:
@@ -21,30 +25,19 @@ class ScalabilityAnalyzer:
         Returns:
             Scalability analysis
         """
-        # Group by grid size (inferred from difficulty)
-        size_map = {
-            'easy': '20x20',
-            'medium': '30x30',
-            'hard': '40x40',
-            'extreme': '50x50'
-        }
-        
-        by_size = {}
-        for result in results:
-            size = size_map.get(result['difficulty'], 'unknown')
-            if size not in by_size:
-                by_size[size] = []
-            by_size[size].append(result)
-        
+        by_size, _ = _accumulate(results)
+        return ScalabilityAnalyzer.summarize(by_size)
+    
+    @staticmethod
+    def summarize(by_size: Dict) -> Dict:
+        """Scalability analysis from per-size stats built by _accumulate."""
         analysis = {}
-        for size, size_results in by_size.items():
-            durations = [r['avg_timestep_duration'] for r in size_results]
-            rescue_rates = [r['rescue_rate'] for r in size_results]
-            
+        for size, stats in by_size.items():
+            count = stats.count
             analysis[size] = {
-                'avg_timestep_ms': round(StatisticalAnalyzer.calculate_mean(durations) * 1000, 2),
-                'avg_rescue_rate': round(StatisticalAnalyzer.calculate_mean(rescue_rates), 3),
-                'sample_count': len(size_results)
+                'avg_timestep_ms': round(stats.duration_sum / count * 1000, 2),
+                'avg_rescue_rate': round(stats.rescue_sum / count, 3),
+                'sample_count': count
             }
         
         return analysis
@@ -52,18 +45,21 @@ class ScalabilityAnalyzer:
     @staticmethod
     def print_scalability_report(analysis: Dict):
         """Print formatted scalability report."""
-        print("\n" + "="*70)
-        print("SCALABILITY ANALYSIS")
-        print("="*70 + "\n")
+        lines = []
+        lines.append("\n" + "="*70)
+        lines.append("SCALABILITY ANALYSIS")
+        lines.append("="*70 + "\n")
         
-        print(f"{'Grid Size':<15} | {'Avg Timestep':<15} | {'Rescue Rate':<15} | {'Samples':<10}")
-        print("-"*70)
+        lines.append(f"{'Grid Size':<15} | {'Avg Timestep':<15} | {'Rescue Rate':<15} | {'Samples':<10}")
+        lines.append("-"*70)
         
         for size, stats in sorted(analysis.items()):
-            print(f"{size:<15} | {stats['avg_timestep_ms']:>13.2f}ms | "
-                  f"{stats['avg_rescue_rate']*100:>13.1f}% | {stats['sample_count']:<10}")
+            lines.append(f"{size:<15} | {stats['avg_timestep_ms']:>13.2f}ms | "
+                         f"{stats['avg_rescue_rate']*100:>13.1f}% | {stats['sample_count']:<10}")
         
-        print("\n" + "="*70 + "\n")
+        lines.append("\n" + "="*70 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class SuccessAnalyzer:
@@ -80,44 +76,25 @@ class SuccessAnalyzer:
         Returns:
             Success pattern analysis
         """
-        by_difficulty = {}
-        
-        for result in results:
-            diff = result['difficulty']
-            if diff not in by_difficulty:
-                by_difficulty[diff] = {
-                    'total': 0,
-                    'completed': 0,
-                    'rescue_rates': [],
-                    'timeout_count': 0,
-                    'partial_success': 0
-                }
-            
-            stats = by_difficulty[diff]
-            stats['total'] += 1
-            stats['rescue_rates'].append(result['rescue_rate'])
-            
-            if result['completed']:
-                stats['completed'] += 1
-            elif result['timesteps'] >= result['max_timesteps']:
-                stats['timeout_count'] += 1
-            
-            if 0 < result['rescue_rate'] < 1.0:
-                stats['partial_success'] += 1
-        
+        _, by_difficulty = _accumulate(results)
+        return SuccessAnalyzer.summarize(by_difficulty)
+    
+    @staticmethod
+    def summarize(by_difficulty: Dict) -> Dict:
+        """Success pattern analysis from per-difficulty stats built by _accumulate."""
         # Calculate summary statistics
         analysis = {}
         for diff, stats in by_difficulty.items():
-            completion_rate = stats['completed'] / stats['total'] if stats['total'] > 0 else 0
-            avg_rescue_rate = StatisticalAnalyzer.calculate_mean(stats['rescue_rates'])
+            completion_rate = stats.completed / stats.total
+            avg_rescue_rate = stats.rescue_sum / stats.total
             
             analysis[diff] = {
-                'total_runs': stats['total'],
-                'completed': stats['completed'],
+                'total_runs': stats.total,
+                'completed': stats.completed,
                 'completion_rate': round(completion_rate, 3),
                 'avg_rescue_rate': round(avg_rescue_rate, 3),
-                'timeout_count': stats['timeout_count'],
-                'partial_success': stats['partial_success']
+                'timeout_count': stats.timeout_count,
+                'partial_success': stats.partial_success
             }
         
         return analysis
@@ -125,20 +102,23 @@ class SuccessAnalyzer:
     @staticmethod
     def print_success_report(analysis: Dict):
         """Print formatted success analysis report."""
-        print("\n" + "="*80)
-        print("SUCCESS RATE ANALYSIS")
-        print("="*80 + "\n")
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("SUCCESS RATE ANALYSIS")
+        lines.append("="*80 + "\n")
         
-        print(f"{'Difficulty':<12} | {'Runs':<6} | {'Completed':<10} | {'Comp %':<8} | "
-              f"{'Rescue %':<10} | {'Timeouts':<10}")
-        print("-"*80)
+        lines.append(f"{'Difficulty':<12} | {'Runs':<6} | {'Completed':<10} | {'Comp %':<8} | "
+                     f"{'Rescue %':<10} | {'Timeouts':<10}")
+        lines.append("-"*80)
         
         for diff, stats in sorted(analysis.items()):
-            print(f"{diff:<12} | {stats['total_runs']:<6} | {stats['completed']:<10} | "
-                  f"{stats['completion_rate']*100:>6.1f}% | "
-                  f"{stats['avg_rescue_rate']*100:>8.1f}% | {stats['timeout_count']:<10}")
+            lines.append(f"{diff:<12} | {stats['total_runs']:<6} | {stats['completed']:<10} | "
+                         f"{stats['completion_rate']*100:>6.1f}% | "
+                         f"{stats['avg_rescue_rate']*100:>8.1f}% | {stats['timeout_count']:<10}")
         
-        print("\n" + "="*80 + "\n")
+        lines.append("\n" + "="*80 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class ModeAnalyzer:
@@ -155,41 +135,24 @@ class ModeAnalyzer:
         Returns:
             Mode switch analysis
         """
-        by_difficulty = {}
-        
-        for result in results:
-            diff = result['difficulty']
-            if diff not in by_difficulty:
-                by_difficulty[diff] = {
-                    'switch_counts': [],
-                    'rescue_rates': [],
-                    'with_switches': 0,
-                    'without_switches': 0
-                }
-            
-            stats = by_difficulty[diff]
-            switch_count = result['mode_switches']
-            stats['switch_counts'].append(switch_count)
-            stats['rescue_rates'].append(result['rescue_rate'])
-            
-            if switch_count > 0:
-                stats['with_switches'] += 1
-            else:
-                stats['without_switches'] += 1
-        
+        _, by_difficulty = _accumulate(results)
+        return ModeAnalyzer.summarize(by_difficulty)
+    
+    @staticmethod
+    def summarize(by_difficulty: Dict) -> Dict:
+        """Mode switch analysis from per-difficulty stats built by _accumulate."""
         # Calculate correlations
         analysis = {}
         for diff, stats in by_difficulty.items():
-            avg_switches = StatisticalAnalyzer.calculate_mean(stats['switch_counts'])
-            avg_rescue_rate = StatisticalAnalyzer.calculate_mean(stats['rescue_rates'])
+            avg_switches = stats.switch_sum / stats.total
+            avg_rescue_rate = stats.rescue_sum / stats.total
             
             analysis[diff] = {
                 'avg_switches': round(avg_switches, 2),
                 'avg_rescue_rate': round(avg_rescue_rate, 3),
-                'runs_with_switches': stats['with_switches'],
-                'runs_without_switches': stats['without_switches'],
-                'switch_frequency': round(stats['with_switches'] / len(stats['switch_counts']), 3)
-                    if stats['switch_counts'] else 0
+                'runs_with_switches': stats.with_switches,
+                'runs_without_switches': stats.without_switches,
+                'switch_frequency': round(stats.with_switches / stats.total, 3)
             }
         
         return analysis
@@ -197,20 +160,23 @@ class ModeAnalyzer:
     @staticmethod
     def print_mode_report(analysis: Dict):
         """Print formatted mode switching report."""
-        print("\n" + "="*80)
-        print("MODE SWITCHING ANALYSIS")
-        print("="*80 + "\n")
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("MODE SWITCHING ANALYSIS")
+        lines.append("="*80 + "\n")
         
-        print(f"{'Difficulty':<12} | {'Avg Switches':<14} | {'Rescue Rate':<13} | "
-              f"{'Switch Freq':<12}")
-        print("-"*80)
+        lines.append(f"{'Difficulty':<12} | {'Avg Switches':<14} | {'Rescue Rate':<13} | "
+                     f"{'Switch Freq':<12}")
+        lines.append("-"*80)
         
         for diff, stats in sorted(analysis.items()):
-            print(f"{diff:<12} | {stats['avg_switches']:>12.2f} | "
-                  f"{stats['avg_rescue_rate']*100:>11.1f}% | "
-                  f"{stats['switch_frequency']*100:>10.1f}%")
+            lines.append(f"{diff:<12} | {stats['avg_switches']:>12.2f} | "
+                         f"{stats['avg_rescue_rate']*100:>11.1f}% | "
+                         f"{stats['switch_frequency']*100:>10.1f}%")
+        
+        lines.append("\n" + "="*80 + "\n")
         
-        print("\n" + "="*80 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class AgentAnalyzer:
@@ -227,28 +193,18 @@ class AgentAnalyzer:
         Returns:
             Agent performance analysis
         """
-        by_difficulty = {}
-        
-        for result in results:
-            diff = result['difficulty']
-            if diff not in by_difficulty:
-                by_difficulty[diff] = {
-                    'agents_spawned': [],
-                    'rescue_rates': [],
-                    'final_agent_counts': []
-                }
-            
-            stats = by_difficulty[diff]
-            stats['agents_spawned'].append(result['agents_spawned'])
-            stats['rescue_rates'].append(result['rescue_rate'])
-            stats['final_agent_counts'].append(result['final_agent_count'])
-        
+        _, by_difficulty = _accumulate(results)
+        return AgentAnalyzer.summarize(by_difficulty)
+    
+    @staticmethod
+    def summarize(by_difficulty: Dict) -> Dict:
+        """Agent performance analysis from per-difficulty stats built by _accumulate."""
         # Calculate statistics
         analysis = {}
         for diff, stats in by_difficulty.items():
-            avg_spawned = StatisticalAnalyzer.calculate_mean(stats['agents_spawned'])
-            avg_rescue_rate = StatisticalAnalyzer.calculate_mean(stats['rescue_rates'])
-            avg_final_count = StatisticalAnalyzer.calculate_mean(stats['final_agent_counts'])
+            avg_spawned = stats.spawned_sum / stats.total
+            avg_rescue_rate = stats.rescue_sum / stats.total
+            avg_final_count = stats.final_count_sum / stats.total
             
             # Calculate efficiency (rescue rate per agent)
             efficiency = avg_rescue_rate / avg_final_count if avg_final_count > 0 else 0
@@ -265,21 +221,130 @@ class AgentAnalyzer:
     @staticmethod
     def print_agent_report(analysis: Dict):
         """Print formatted agent performance report."""
-        print("\n" + "="*80)
-        print("AGENT PERFORMANCE ANALYSIS")
-        print("="*80 + "\n")
+        lines = []
+        lines.append("\n" + "="*80)
+        lines.append("AGENT PERFORMANCE ANALYSIS")
+        lines.append("="*80 + "\n")
         
-        print(f"{'Difficulty':<12} | {'Spawned':<10} | {'Final Count':<13} | "
-              f"{'Rescue Rate':<13} | {'Efficiency':<12}")
-        print("-"*80)
+        lines.append(f"{'Difficulty':<12} | {'Spawned':<10} | {'Final Count':<13} | "
+                     f"{'Rescue Rate':<13} | {'Efficiency':<12}")
+        lines.append("-"*80)
         
         for diff, stats in sorted(analysis.items()):
-            print(f"{diff:<12} | {stats['avg_agents_spawned']:>8.2f} | "
-                  f"{stats['avg_final_agent_count']:>11.1f} | "
-                  f"{stats['avg_rescue_rate']*100:>11.1f}% | "
-                  f"{stats['efficiency_per_agent']:>10.4f}")
+            lines.append(f"{diff:<12} | {stats['avg_agents_spawned']:>8.2f} | "
+                         f"{stats['avg_final_agent_count']:>11.1f} | "
+                         f"{stats['avg_rescue_rate']*100:>11.1f}% | "
+                         f"{stats['efficiency_per_agent']:>10.4f}")
+        
+        lines.append("\n" + "="*80 + "\n")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Grid size per difficulty, used to group the scalability analysis
+_SIZE_MAP = {
+    'easy': '20x20',
+    'medium': '30x30',
+    'hard': '40x40',
+    'extreme': '50x50'
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class SizeAccum:
+    """Running totals for one grid size (scalability analysis)."""
+    count: int = 0
+    duration_sum: float = 0.0
+    rescue_sum: float = 0.0
+
+
+@dataclass(**DATACLASS_SLOTS)
+class DifficultyAccum:
+    """Running totals for one difficulty (success, mode and agent analyses)."""
+    total: int = 0
+    completed: int = 0
+    rescue_sum: float = 0.0
+    timeout_count: int = 0
+    partial_success: int = 0
+    switch_sum: int = 0
+    with_switches: int = 0
+    without_switches: int = 0
+    spawned_sum: int = 0
+    final_count_sum: int = 0
+
+
+def _accumulate(
+    results: List[Dict]
+) -> Tuple[Dict[str, SizeAccum], Dict[str, DifficultyAccum]]:
+    """
+    Collect the inputs of every analyzer in a single pass over results.
+    
+    Means are kept as running sums and counts in slotted accumulators,
+    divided once in the analyzers' summarize(), rather than as per-record
+    value lists.
+    
+    Args:
+        results: Benchmark results
+        
+    Returns:
+        (by_size, by_difficulty): per-grid-size stats for the scalability
+        analysis and per-difficulty stats shared by the other analyzers
+    """
+    by_size = defaultdict(SizeAccum)
+    by_difficulty = defaultdict(DifficultyAccum)
+    
+    for result in results:
+        diff = result['difficulty']
+        rescue_rate = result['rescue_rate']
+        
+        size_stats = by_size[_SIZE_MAP.get(diff, 'unknown')]
+        size_stats.count += 1
+        size_stats.duration_sum += result['avg_timestep_duration']
+        size_stats.rescue_sum += rescue_rate
+        
+        stats = by_difficulty[diff]
+        
+        # Success patterns (flags are added as 0/1 rather than branched on)
+        completed = bool(result['completed'])
+        stats.total += 1
+        stats.rescue_sum += rescue_rate
+        stats.completed += completed
+        stats.timeout_count += (not completed
+                                and result['timesteps'] >= result['max_timesteps'])
+        stats.partial_success += 0 < rescue_rate < 1.0
+        
+        # Mode switching
+        switch_count = result['mode_switches']
+        switched = switch_count > 0
+        stats.switch_sum += switch_count
+        stats.with_switches += switched
+        stats.without_switches += not switched
         
-        print("\n" + "="*80 + "\n")
+        # Agent performance
+        stats.spawned_sum += result['agents_spawned']
+        stats.final_count_sum += result['final_agent_count']
+    
+    return by_size, by_difficulty
+
+
+def run_fused_analysis(results: List[Dict]) -> Dict:
+    """
+    Compute all four analyses from one scan of the results.
+    
+    Args:
+        results: List of benchmark results
+        
+    Returns:
+        Dictionary with scalability, success, modes and agents analyses
+    """
+    by_size, by_difficulty = _accumulate(results)
+    
+    return {
+        'scalability': ScalabilityAnalyzer.summarize(by_size),
+        'success': SuccessAnalyzer.summarize(by_difficulty),
+        'modes': ModeAnalyzer.summarize(by_difficulty),
+        'agents': AgentAnalyzer.summarize(by_difficulty)
+    }
 
 
 def run_comprehensive_analysis(results: List[Dict]):
@@ -293,25 +358,11 @@ def run_comprehensive_analysis(results: List[Dict]):
     print("COMPREHENSIVE BENCHMARK ANALYSIS")
     print("="*80)
     
-    # Scalability Analysis
-    scalability = ScalabilityAnalyzer.analyze_scalability(results)
-    ScalabilityAnalyzer.print_scalability_report(scalability)
+    analysis = run_fused_analysis(results)
     
-    # Success Analysis
-    success = SuccessAnalyzer.analyze_success_patterns(results)
-    SuccessAnalyzer.print_success_report(success)
+    ScalabilityAnalyzer.print_scalability_report(analysis['scalability'])
+    SuccessAnalyzer.print_success_report(analysis['success'])
+    ModeAnalyzer.print_mode_report(analysis['modes'])
+    AgentAnalyzer.print_agent_report(analysis['agents'])
     
-    # Mode Switching Analysis
-    modes = ModeAnalyzer.analyze_mode_switches(results)
-    ModeAnalyzer.print_mode_report(modes)
-    
-    # Agent Performance Analysis
-    agents = AgentAnalyzer.analyze_agent_performance(results)
-    AgentAnalyzer.print_agent_report(agents)
-    
-    return {
-        'scalability': scalability,
-        'success': success,
-        'modes': modes,
-        'agents': agents
-    }
+    return analysis
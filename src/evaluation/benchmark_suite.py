@@ -3,12 +3,16 @@ Benchmark Suite for Multi-Agent Rescue System
 Automated testing across multiple scenarios and difficulties.
 """
 
+import os
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Tuple
 from datetime import datetime
 from ..core.simulator import Simulator
-from ..utils.logger import get_logger
+from ..utils.config import LOG
+from ..utils.logger import get_logger, reset_logger
 
 
 class BenchmarkSuite:
@@ -69,8 +73,6 @@ class BenchmarkSuite:
         # Create simulator (headless mode)
         start_time = time.time()
         
-        # Import here to avoid circular dependency
-        import os
         os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Headless mode
         
         sim = Simulator(
@@ -78,22 +80,13 @@ class BenchmarkSuite:
             coordination_mode='hybrid',
             enable_spawning=True,
             verbose=False,  # Disable explainability for speed
-            difficulty=difficulty
+            difficulty=difficulty,
+            headless=True  # No renderer window
         )
         
-        sim.initialize()
-        
-        # Run simulation (headless)
-        timestep = 0
-        while sim.running and timestep < max_timesteps:
-            # Execute timestep without rendering
-            sim._execute_timestep()
-            timestep += 1
-            
-            # Check win condition
-            state = sim.grid.get_grid_state_summary()
-            if state['survivors'] == 0:
-                break
+        # Run simulation (headless) until all survivors are rescued or the
+        # limit is hit; finalize() is skipped, it only writes run reports
+        timestep = sim.run_headless(max_timesteps, finalize_run=False)
         
         end_time = time.time()
         duration = end_time - start_time
@@ -134,7 +127,8 @@ class BenchmarkSuite:
         
         return results
     
-    def run_benchmark_set(self, difficulty: str, runs: int = 10, seeds: List[int] = None) -> List[Dict]:
+    def run_benchmark_set(self, difficulty: str, runs: int = 10, seeds: List[int] = None,
+                          workers: int = 1) -> List[Dict]:
         """
         Run multiple benchmarks for a difficulty level.
         
@@ -142,31 +136,36 @@ class BenchmarkSuite:
             difficulty: Scenario difficulty
             runs: Number of runs
             seeds: List of seeds (auto-generated if None)
+            workers: Worker processes (1 runs in-process)
             
         Returns:
             List of result dictionaries
+        
+        Timings measured with workers > 1 share the CPU with the other
+        runs and are not comparable with sequential (workers=1) results.
         """
         if seeds is None:
             # Generate seeds
             seeds = [42 + i * 100 for i in range(runs)]
         
-        results = []
-        for seed in seeds[:runs]:
-            result = self.run_single_benchmark(difficulty, seed)
-            results.append(result)
-            self.results.append(result)
+        results = self._run_tasks([(difficulty, seed) for seed in seeds[:runs]], workers)
+        self.results.extend(results)
         
         return results
     
-    def run_all_benchmarks(self, runs_per_difficulty: int = 10) -> Dict:
+    def run_all_benchmarks(self, runs_per_difficulty: int = 10, workers: int = 1) -> Dict:
         """
         Run complete benchmark suite across all difficulties.
         
         Args:
             runs_per_difficulty: Number of runs per difficulty level
+            workers: Worker processes (1 runs in-process)
             
         Returns:
             Summary statistics
+        
+        Timings measured with workers > 1 share the CPU with the other
+        runs and are not comparable with sequential (workers=1) results.
         """
         print(f"\n{'='*80}")
         print(f"RUNNING FULL BENCHMARK SUITE")
@@ -176,12 +175,18 @@ class BenchmarkSuite:
         
         suite_start = time.time()
         
-        for difficulty in self.scenarios.keys():
-            print(f"\n{'='*80}")
-            print(f"DIFFICULTY: {difficulty.upper()}")
-            print(f"{'='*80}")
-            
-            self.run_benchmark_set(difficulty, runs=runs_per_difficulty)
+        if workers <= 1:
+            for difficulty in self.scenarios.keys():
+                print(f"\n{'='*80}")
+                print(f"DIFFICULTY: {difficulty.upper()}")
+                print(f"{'='*80}")
+                
+                self.run_benchmark_set(difficulty, runs=runs_per_difficulty)
+        else:
+            # One pool for every run, so slow extreme runs overlap fast easy ones
+            seeds = [42 + i * 100 for i in range(runs_per_difficulty)]
+            tasks = [(difficulty, seed) for difficulty in self.scenarios for seed in seeds]
+            self.results.extend(self._run_tasks(tasks, workers))
         
         suite_duration = time.time() - suite_start
         
@@ -198,6 +203,34 @@ class BenchmarkSuite:
         
         return summary
     
+    def _run_tasks(self, tasks: List[Tuple[str, int]], workers: int = 1) -> List[Dict]:
+        """
+        Run (difficulty, seed) benchmarks, in parallel when possible.
+        
+        Args:
+            tasks: Benchmarks to run
+            workers: Worker processes (1 runs in-process)
+            
+        Returns:
+            Results in task order
+        
+        Every run builds its own Simulator from its seed, so runs are
+        independent and CPU-bound: they spread across processes and give
+        the same rescue metrics as running them one after another. Their
+        duration_seconds and avg_timestep_duration are measured under full
+        CPU load, though, so use workers=1 when timings matter. Workers do
+        not write the simulation log (see _init_benchmark_worker); per-run
+        progress output may interleave.
+        """
+        workers = min(workers, len(tasks))
+        
+        if workers <= 1:
+            return [self.run_single_benchmark(difficulty, seed) for difficulty, seed in tasks]
+        
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_benchmark_worker) as pool:
+            return list(pool.map(_run_benchmark_task, tasks))
+    
     def generate_summary(self) -> Dict:
         """
         Generate summary statistics from all results.
@@ -213,23 +246,19 @@ class BenchmarkSuite:
             'overall': {}
         }
         
-        # Group by difficulty
-        by_difficulty = {}
+        # Group by difficulty: one scan pulls each result's summary fields
+        # as a row, then zip() transposes each group into columns
+        row_of = itemgetter('rescue_rate', 'timesteps', 'agents_spawned', 'mode_switches')
+        rows_by_difficulty = {}
         for result in self.results:
-            diff = result['difficulty']
-            if diff not in by_difficulty:
-                by_difficulty[diff] = []
-            by_difficulty[diff].append(result)
+            rows_by_difficulty.setdefault(result['difficulty'], []).append(row_of(result))
         
         # Calculate statistics per difficulty
-        for diff, results in by_difficulty.items():
-            rescue_rates = [r['rescue_rate'] for r in results]
-            timesteps = [r['timesteps'] for r in results]
-            agents_spawned = [r['agents_spawned'] for r in results]
-            mode_switches = [r['mode_switches'] for r in results]
+        for diff, rows in rows_by_difficulty.items():
+            rescue_rates, timesteps, agents_spawned, mode_switches = zip(*rows)
             
             summary['by_difficulty'][diff] = {
-                'runs': len(results),
+                'runs': len(rows),
                 'rescue_rate': {
                     'mean': round(sum(rescue_rates) / len(rescue_rates), 3),
                     'min': round(min(rescue_rates), 3),
@@ -280,8 +309,10 @@ class BenchmarkSuite:
             'summary': self.generate_summary()
         }
         
+        # json.dump would stream hundreds of small writes through the
+        # pure-Python indenting encoder; encode once and write once
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(json.dumps(data, indent=2))
         
         print(f"\n[EXPORT] Results saved to: {filename}")
         
@@ -316,6 +347,29 @@ class BenchmarkSuite:
         print(f"\n{'='*80}\n")
 
 
+def _init_benchmark_worker():
+    """
+    Process pool initializer: make a worker safe to run benchmarks.
+    
+    Every Simulator resets the global logger, which truncates and then
+    appends to LOG.LOG_FILE_PATH. Concurrent workers would clobber that
+    one file, so workers log neither to file nor to console; only the
+    per-run benchmark output reaches the terminal. Run with workers=1
+    for a simulation log.
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'  # Headless mode
+    
+    LOG.LOG_TO_FILE = False
+    LOG.LOG_TO_CONSOLE = False
+    reset_logger()
+
+
+def _run_benchmark_task(task: Tuple[str, int]) -> Dict:
+    """Process pool entry point: run one (difficulty, seed) benchmark."""
+    difficulty, seed = task
+    return BenchmarkSuite().run_single_benchmark(difficulty, seed)
+
+
 def main():
     """Run benchmark suite from command line."""
     import argparse
@@ -325,15 +379,18 @@ def main():
                        default='all', help='Difficulty level to benchmark')
     parser.add_argument('--runs', type=int, default=10, help='Number of runs per difficulty')
     parser.add_argument('--output', type=str, help='Output filename for results')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes (default: 1; more run faster, but their timings are '
+                            'measured under CPU contention and skew the scalability report)')
     
     args = parser.parse_args()
     
     suite = BenchmarkSuite()
     
     if args.difficulty == 'all':
-        suite.run_all_benchmarks(runs_per_difficulty=args.runs)
+        suite.run_all_benchmarks(runs_per_difficulty=args.runs, workers=args.workers)
     else:
-        suite.run_benchmark_set(args.difficulty, runs=args.runs)
+        suite.run_benchmark_set(args.difficulty, runs=args.runs, workers=args.workers)
     
     suite.print_summary()
     suite.export_results(args.output)
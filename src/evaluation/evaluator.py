@@ -53,7 +53,8 @@ class EvaluationFramework:
             simulator = Simulator(
                 seed=seed,
                 coordination_mode=protocol,
-                enable_spawning=True
+                enable_spawning=True,
+                headless=True
             )
             simulator.initialize()
             
@@ -15,6 +15,7 @@ import sys
 import argparse
 from src.core.simulator import Simulator
 from src.utils.config import SIMULATION, GRID, HAZARD
+from src.data.scenarios import check_standard_scenario
 
 
 def parse_grid_size(value):
@@ -191,6 +192,15 @@ Examples:
         SIMULATION.NUM_INITIAL_FLOODS = max(1, hazard_cells // 3)
         SIMULATION.NUM_INITIAL_DEBRIS = max(1, hazard_cells // 3)
     
+    # The grid must have room to place everything
+    error = check_standard_scenario(GRID.WIDTH, GRID.HEIGHT, SIMULATION.NUM_SURVIVORS,
+                                    SIMULATION.NUM_INITIAL_FIRES,
+                                    SIMULATION.NUM_INITIAL_FLOODS,
+                                    SIMULATION.NUM_INITIAL_DEBRIS)
+    if error:
+        print(f"ERROR: {error}")
+        sys.exit(1)
+    
     # Update simulation parameters
     SIMULATION.RANDOM_SEED = args.seed
     SIMULATION.MAX_TIMESTEPS = args.max_timesteps
@@ -5,6 +5,7 @@ Simple GUI for manual parameter configuration before simulation starts.
 
 import pygame
 from typing import Dict, Optional, Tuple
+from ..data.scenarios import check_standard_scenario
 
 
 class ConfigDialog:
@@ -181,6 +182,16 @@ class ConfigDialog:
                 self._show_error("Hazard coverage must be 0-50%")
                 return None
             
+            # The grid must have room to place everything (same hazard
+            # split as main_interactive applies)
+            hazard_cells = int(grid_width * grid_height * hazard_coverage / 100)
+            per_type = max(1, hazard_cells // 3)
+            error = check_standard_scenario(grid_width, grid_height, survivors,
+                                            per_type, per_type, per_type)
+            if error:
+                self._show_error(error)
+                return None
+            
             return {
                 'grid_width': grid_width,
                 'grid_height': grid_height,
@@ -1 +1 @@
-"""Utility modules: constants, configuration, logging."""
+"""Utility modules: constants, configuration, logging, compatibility helpers."""
@@ -0,0 +1,24 @@
+"""
+Python Version Compatibility Helpers
+Keeps optional interpreter features usable while supporting Python 3.8+.
+"""
+
+import sys
+
+
+# Keyword arguments for @dataclass that enable __slots__ where supported.
+# dataclass(slots=True) needs Python 3.10; older interpreters fall back to
+# regular __dict__-backed instances with identical behaviour.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    from enum import Enum
+
+    class StrEnum(str, Enum):
+        """Enum whose members are also strings (backport of enum.StrEnum)."""
+
+        def __str__(self) -> str:
+            return str.__str__(self)
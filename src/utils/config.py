@@ -162,6 +162,17 @@ class CellType:
     UNEXPLORED = 7
 
 
+# Cell flag bits
+class CellFlag:
+    """Bit flags packed into one byte per cell (Grid.flags)."""
+    FIRE = 1
+    FLOOD = 2
+    DEBRIS = 4
+    SURVIVOR = 8
+    SAFE_ZONE = 16
+    BLOCKING = FIRE | DEBRIS  # Cell.is_passable() is False
+
+
 # Agent type enumeration
 class AgentType:
     """Enumeration of agent types."""
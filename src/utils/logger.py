@@ -54,6 +54,21 @@ class SimulationLogger:
             f.write(f"Detail Level: {self.detail_level}\n")
             f.write("=" * 80 + "\n\n")
     
+    def enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages at a level pass the detail filter.
+        
+        Args:
+            level: MINIMAL, NORMAL, or VERBOSE
+            
+        Returns:
+            True if _write would record such a message
+            
+        Callers check this before building expensive messages, so nothing
+        is formatted only to be dropped.
+        """
+        return level == "MINIMAL" or self.detail_level != "MINIMAL"
+    
     def _write(self, message: str, level: str = "NORMAL"):
         """
         Write message to log.
@@ -63,9 +78,7 @@ class SimulationLogger:
             level: MINIMAL, NORMAL, or VERBOSE
         """
         # Filter by detail level
-        if level == "VERBOSE" and self.detail_level == "MINIMAL":
-            return
-        if level == "NORMAL" and self.detail_level == "MINIMAL":
+        if not self.enabled_for(level):
             return
         
         # Add to memory
@@ -91,6 +104,8 @@ class SimulationLogger:
         self._write("\n" + "=" * 80, "MINIMAL")
         self._write(f"TIMESTEP {timestep}", "MINIMAL")
         self._write("=" * 80, "MINIMAL")
+        if not self.enabled_for("NORMAL"):
+            return
         self._write(
             f"Environment: {grid_state['fires']} fires, {grid_state['floods']} floods, "
             f"{grid_state['debris']} debris, {grid_state['survivors']} survivors remaining",
@@ -106,6 +121,8 @@ class SimulationLogger:
             position: Current (x, y) position
             observations: Dictionary of perceived state
         """
+        if not self.enabled_for("VERBOSE"):
+            return
         self._write(f"\n[{agent_id}] PERCEPTION at {position}:", "VERBOSE")
         for key, value in observations.items():
             self._write(f"  - {key}: {value}", "VERBOSE")
@@ -119,6 +136,8 @@ class SimulationLogger:
             position: Position being evaluated
             risk_values: Dictionary of risk types and probabilities
         """
+        if not self.enabled_for("VERBOSE"):
+            return
         self._write(
             f"[{agent_id}] RISK at {position}: " +
             ", ".join([f"{k}={v:.3f}" for k, v in risk_values.items()]),
@@ -132,6 +151,8 @@ class SimulationLogger:
         Args:
             allocations: Dictionary mapping agents to assigned tasks
         """
+        if not self.enabled_for("NORMAL"):
+            return
         self._write("\nCSP TASK ALLOCATION:", "NORMAL")
         for agent, task in allocations.items():
             self._write(f"  {agent} -> {task}", "NORMAL")
@@ -185,6 +206,9 @@ class SimulationLogger:
             position: Position where action occurred
             result: Outcome description
         """
+        if not self.enabled_for("NORMAL"):
+            return
+        
         # Make result more readable
         if "Unknown action type" in result:
             result = "⚠️ Unhandled action"
@@ -237,6 +261,8 @@ class SimulationLogger:
             metric_name: Name of metric
             value: Metric value
         """
+        if not self.enabled_for("NORMAL"):
+            return
         self._write(f"METRIC: {metric_name} = {value}", "NORMAL")
     
     def log_error(self, agent_id: str, error: str):